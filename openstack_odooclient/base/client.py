@@ -17,7 +17,10 @@ from __future__ import annotations
 
 import ssl
 import urllib.request
+import weakref
 
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
 from typing import TYPE_CHECKING, overload
 
@@ -26,16 +29,29 @@ from packaging.version import Version
 from typing_extensions import get_type_hints
 
 from ..util import is_subclass
+from .connection import (
+    ConnectionPool,
+    KeepAliveHTTPHandler,
+    KeepAliveHTTPSHandler,
+)
 from .record import RecordBase
 from .record_manager import RecordManagerBase
 
 if TYPE_CHECKING:
-    from typing import Dict, Literal, Optional, Type, Union
+    from typing import Dict, Iterator, List, Literal, Optional, Type, Union
 
     from odoorpc.db import DB  # type: ignore[import]
     from odoorpc.env import Environment  # type: ignore[import]
     from odoorpc.report import Report  # type: ignore[import]
 
+_prefetch_scopes: ContextVar[
+    Optional[Dict[ClientBase, Dict[Type[RecordBase], List[RecordBase]]]]
+] = ContextVar("prefetch_scopes", default=None)
+"""The prefetch scopes active in the current context,
+holding the record objects fetched by each client within the scope,
+grouped by record class.
+"""
+
 
 class ClientBase:
     """The client base class for managing the OpenStack Odoo ERP.
@@ -141,12 +157,19 @@ class ClientBase:
         version: Optional[str] = None,
         odoo: Optional[ODOO] = None,
     ) -> None:
+        self._connection_pools: List[ConnectionPool] = []
+        """The pools of persistent connections to the Odoo server
+        used by this client, if it created its own OdooRPC connection object.
+        """
         # If an OdooRPC object is provided, use that directly.
         # Otherwise, make a new one with the provided settings.
         if odoo:
             self._odoo = odoo
         else:
-            opener = None
+            # Connections to the server are kept alive and reused
+            # between requests, to avoid having to open a new connection
+            # (and perform a new TLS handshake) for every request.
+            ssl_context = None
             if protocol.endswith("+ssl"):
                 ssl_verify = verify is not False
                 ssl_cafile = (
@@ -157,10 +180,17 @@ class ClientBase:
                     if not ssl_verify:
                         ssl_context.check_hostname = False
                         ssl_context.verify_mode = ssl.CERT_NONE
-                    opener = urllib.request.build_opener(
-                        urllib.request.HTTPSHandler(context=ssl_context),
-                        urllib.request.HTTPCookieProcessor(),
-                    )
+            http_handler = KeepAliveHTTPHandler()
+            https_handler = KeepAliveHTTPSHandler(context=ssl_context)
+            self._connection_pools = [http_handler.pool, https_handler.pool]
+            # Close idle connections once the client is discarded.
+            for pool in self._connection_pools:
+                weakref.finalize(self, pool.close)
+            opener = urllib.request.build_opener(
+                http_handler,
+                https_handler,
+                urllib.request.HTTPCookieProcessor(),
+            )
             self._odoo = ODOO(
                 protocol=protocol,
                 host=hostname,
@@ -227,3 +257,62 @@ class ClientBase:
     def version_str(self) -> str:
         """The version of the server, as a string."""
         return self._odoo.version
+
+    def close(self) -> None:
+        """Close all idle connections to the Odoo server
+        kept alive by this client.
+
+        The client can still be used after closing the connections,
+        with new connections being opened when required.
+        Idle connections are also closed when the client object
+        is garbage collected.
+        """
+        for pool in self._connection_pools:
+            pool.close()
+
+    @contextmanager
+    def prefetch_scope(self) -> Iterator[None]:
+        """Open a scope in which record objects fetched by this client
+        are reused for the lifetime of the scope.
+
+        Within the scope, all record objects fetched with the default
+        set of fields are kept in the record cache until the scope exits,
+        and ``get`` calls on the managers return the cached record object
+        instead of fetching the record from Odoo again.
+        Model refs that resolve to the same record on different
+        record objects are only fetched once.
+
+        When a model ref that returns record objects is accessed
+        for the first time on a record object, the model ref is also
+        resolved for all other record objects of the same type
+        fetched within the scope, using one request per referenced model
+        (the same as calling ``prefetch`` on the manager).
+
+        >>> with odoo_client.prefetch_scope():
+        ...     for partner in odoo_client.partners.search():
+        ...         print(partner.parent.name)
+
+        The scope is tracked per context (using ``contextvars``),
+        so scopes opened in different threads or asynchronous tasks
+        are independent of each other. Nested scopes reuse the
+        outermost scope.
+        """
+        scopes = _prefetch_scopes.get()
+        if scopes is not None and self in scopes:
+            yield
+            return
+        token = _prefetch_scopes.set({**(scopes or {}), self: {}})
+        try:
+            yield
+        finally:
+            _prefetch_scopes.reset(token)
+
+    @property
+    def _prefetch_scope(
+        self,
+    ) -> Optional[Dict[Type[RecordBase], List[RecordBase]]]:
+        # The record objects kept alive by the currently active
+        # prefetch scope for this client (grouped by record class),
+        # if one is open.
+        scopes = _prefetch_scopes.get()
+        return scopes.get(self) if scopes is not None else None
@@ -0,0 +1,274 @@
+# Copyright (C) 2024 Catalyst Cloud Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import http.client
+import select
+import socket
+import threading
+import urllib.error
+import urllib.request
+import urllib.response
+
+from io import BytesIO
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import ssl
+
+    from typing import Any, Dict, List, Optional, Tuple, Type
+
+
+class ConnectionPool:
+    """A thread-safe pool of persistent HTTP connections,
+    grouped by host.
+
+    The standard ``urllib`` handlers open a new connection
+    (and for HTTPS, perform a new TLS handshake) for every request.
+    This pool instead keeps connections open between requests,
+    and reuses them for subsequent requests to the same host.
+
+    Each connection is only used by one request at a time.
+    Idle connections that have been closed by the server
+    are discarded when they are next taken from the pool.
+    HTTPS requests made through a proxy are tunnelled to the server,
+    and pooled separately for each proxy and server.
+
+    :param connection_class: The connection type to create
+    :type connection_class: Type[http.client.HTTPConnection]
+    :param maxsize: Idle connections to keep per host, defaults to ``10``
+    :type maxsize: int, optional
+    """
+
+    def __init__(
+        self,
+        connection_class: Type[http.client.HTTPConnection],
+        maxsize: int = 10,
+        **connection_kwargs: Any,
+    ) -> None:
+        self.connection_class = connection_class
+        self.maxsize = maxsize
+        self._connection_kwargs = connection_kwargs
+        self._connections: Dict[
+            Tuple[str, Optional[str]],
+            List[http.client.HTTPConnection],
+        ] = {}
+        self._lock = threading.Lock()
+
+    def urlopen(
+        self,
+        req: urllib.request.Request,
+    ) -> urllib.response.addinfourl:
+        """Send a request using a pooled connection,
+        and return the response.
+
+        The response body is read in full before returning,
+        so that the connection can be returned to the pool.
+
+        :param req: The request to send
+        :type req: urllib.request.Request
+        :raises urllib.error.URLError: If the request could not be sent
+        :return: The response
+        :rtype: urllib.response.addinfourl
+        """
+        host = req.host
+        if not host:
+            raise urllib.error.URLError("no host given")
+        # Build the request headers the same way urllib does,
+        # but request that the connection be kept alive.
+        headers = dict(req.unredirected_hdrs)
+        headers.update(
+            {k: v for k, v in req.headers.items() if k not in headers},
+        )
+        headers["Connection"] = "keep-alive"
+        headers = {name.title(): value for name, value in headers.items()}
+        # HTTPS requests sent through a proxy are tunnelled to the server
+        # using CONNECT, in which case the request host is the proxy.
+        # Proxy credentials are only sent when opening the tunnel.
+        tunnel_host: Optional[str] = getattr(req, "_tunnel_host", None)
+        tunnel_headers: Dict[str, str] = {}
+        if tunnel_host and "Proxy-Authorization" in headers:
+            tunnel_headers["Proxy-Authorization"] = headers.pop(
+                "Proxy-Authorization",
+            )
+        key = (host, tunnel_host)
+        connection = self._get_connection(key)
+        reused = connection is not None
+        # Reused connections keep the timeout they were created with,
+        # so apply the timeout for this request instead.
+        if connection is not None:
+            self._set_timeout(connection, req.timeout)
+        while True:
+            if connection is None:
+                connection = self.connection_class(
+                    host,
+                    timeout=req.timeout,  # type: ignore[arg-type]
+                    **self._connection_kwargs,
+                )
+                if tunnel_host:
+                    connection.set_tunnel(tunnel_host, headers=tunnel_headers)
+            try:
+                connection.request(
+                    req.get_method(),
+                    req.selector,
+                    req.data,
+                    headers,
+                )
+                response = connection.getresponse()
+                body = response.read()
+            except (BrokenPipeError, ConnectionResetError) as err:
+                connection.close()
+                # The server may close an idle connection after it was
+                # checked, but before the request was sent.
+                # Retry once using a new connection.
+                if reused:
+                    reused = False
+                    connection = None
+                    continue
+                raise urllib.error.URLError(err) from err
+            except OSError as err:
+                connection.close()
+                raise urllib.error.URLError(err) from err
+            except http.client.HTTPException:
+                connection.close()
+                raise
+            break
+        if response.will_close:
+            connection.close()
+        else:
+            self._put_connection(key, connection)
+        result = urllib.response.addinfourl(
+            BytesIO(body),
+            response.msg,
+            req.full_url,
+            response.status,
+        )
+        # urllib handlers expect the reason to be available here.
+        result.msg = response.reason  # type: ignore[attr-defined]
+        return result
+
+    def close(self) -> None:
+        """Close all idle connections in the pool."""
+        with self._lock:
+            connections = [
+                connection
+                for host_connections in self._connections.values()
+                for connection in host_connections
+            ]
+            self._connections.clear()
+        for connection in connections:
+            connection.close()
+
+    def _get_connection(
+        self,
+        key: Tuple[str, Optional[str]],
+    ) -> Optional[http.client.HTTPConnection]:
+        # Take the most recently used idle connection for the host
+        # (and tunnelled host, if using a proxy), skipping any that
+        # have since been closed by the server.
+        while True:
+            with self._lock:
+                host_connections = self._connections.get(key)
+                if not host_connections:
+                    return None
+                connection = host_connections.pop()
+            if not self._is_dropped(connection):
+                return connection
+            connection.close()
+
+    def _put_connection(
+        self,
+        key: Tuple[str, Optional[str]],
+        connection: http.client.HTTPConnection,
+    ) -> None:
+        with self._lock:
+            host_connections = self._connections.setdefault(key, [])
+            if len(host_connections) < self.maxsize:
+                host_connections.append(connection)
+                return
+        connection.close()
+
+    @staticmethod
+    def _set_timeout(
+        connection: http.client.HTTPConnection,
+        timeout: Any,
+    ) -> None:
+        # urllib passes a sentinel value when no timeout was given,
+        # to use the global default timeout.
+        if timeout is getattr(socket, "_GLOBAL_DEFAULT_TIMEOUT", None):
+            timeout = socket.getdefaulttimeout()
+        connection.timeout = timeout
+        if connection.sock is not None:
+            connection.sock.settimeout(timeout)
+
+    @staticmethod
+    def _is_dropped(connection: http.client.HTTPConnection) -> bool:
+        # An idle connection should have nothing to read.
+        # If the socket is readable, the server has either closed
+        # the connection, or sent unexpected data.
+        if connection.sock is None:
+            return False
+        readable, _, _ = select.select([connection.sock], [], [], 0)
+        return bool(readable)
+
+
+class KeepAliveHTTPHandler(urllib.request.HTTPHandler):
+    """A ``urllib`` handler for HTTP requests that reuses connections
+    to the server between requests.
+
+    :param maxsize: Idle connections to keep per host, defaults to ``10``
+    :type maxsize: int, optional
+    """
+
+    def __init__(self, maxsize: int = 10) -> None:
+        super().__init__()
+        self.pool = ConnectionPool(http.client.HTTPConnection, maxsize)
+
+    def http_open(  # type: ignore[override]
+        self,
+        req: urllib.request.Request,
+    ) -> urllib.response.addinfourl:
+        return self.pool.urlopen(req)
+
+
+class KeepAliveHTTPSHandler(urllib.request.HTTPSHandler):
+    """A ``urllib`` handler for HTTPS requests that reuses connections
+    to the server between requests, avoiding a new TLS handshake
+    for every request.
+
+    :param context: SSL context to use, defaults to ``None`` (default context)
+    :type context: Optional[ssl.SSLContext], optional
+    :param maxsize: Idle connections to keep per host, defaults to ``10``
+    :type maxsize: int, optional
+    """
+
+    def __init__(
+        self,
+        context: Optional[ssl.SSLContext] = None,
+        maxsize: int = 10,
+    ) -> None:
+        super().__init__(context=context)
+        self.pool = ConnectionPool(
+            http.client.HTTPSConnection,
+            maxsize,
+            context=context,
+        )
+
+    def https_open(  # type: ignore[override]
+        self,
+        req: urllib.request.Request,
+    ) -> urllib.response.addinfourl:
+        return self.pool.urlopen(req)
@@ -25,14 +25,18 @@ from typing import (
     Any,
     Dict,
     Generic,
+    Iterable,
+    List,
     Literal,
     Mapping,
     Optional,
     Sequence,
+    Set,
     Type,
     TypeVar,
     Union,
 )
+from weakref import ReferenceType, ref
 
 from typing_extensions import (
     Annotated,
@@ -41,7 +45,7 @@ from typing_extensions import (
     get_origin as get_type_origin,
 )
 
-from ..util import is_subclass
+from ..util import get_mapped_field, is_subclass
 
 if TYPE_CHECKING:
     from odoorpc import ODOO  # type: ignore[import]
@@ -131,6 +135,129 @@ class ModelRef(AnnotationBase):
     record_class: Any
 
 
+@dataclass(frozen=True)
+class ModelRefField:
+    """Pre-parsed information about a model ref field on a record class.
+
+    Generated once per record class from the field's type hint,
+    so that model ref values can be decoded without having to parse
+    the type hint again every time the field is accessed.
+    """
+
+    model_ref: ModelRef
+    """The model ref annotation applied to the field."""
+
+    value_type: Any
+    """The type of the value (or list elements) the field decodes to."""
+
+    record_class: Optional[Type[RecordBase]]
+    """The record class for fields that decode to record objects,
+    or ``None`` for fields that decode to record IDs or names.
+    """
+
+    is_list: bool
+    """Whether or not the field decodes to a list of values."""
+
+    optional: bool
+    """Whether or not the field returns ``empty_value`` when not set."""
+
+    empty_value: Any
+    """The value returned for optional fields when not set
+    (``None`` or ``False``).
+    """
+
+    @classmethod
+    def from_type_hint(
+        cls,
+        type_hint: Any,
+        record_class: Type[RecordBase],
+    ) -> Optional[ModelRefField]:
+        """Parse the type hint for a field on the given record class,
+        and return the model ref field information
+        if the field is a model ref.
+
+        :param type_hint: The type hint to parse
+        :type type_hint: Any
+        :param record_class: The record class the field is defined on
+        :type record_class: Type[RecordBase]
+        :raises ValueError: If the model ref type hint is unsupported
+        :return: Model ref field information, or ``None`` if not a model ref
+        :rtype: Optional[ModelRefField]
+        """
+        model_ref = ModelRef.get(type_hint)
+        if not model_ref:
+            return None
+        attr_type = get_type_args(type_hint)[0]
+        is_list = False
+        optional = False
+        empty_value: Any = None
+        # If the expected attribute type is a list, then the model ref
+        # is processed as a list of model IDs or objects.
+        if get_type_origin(attr_type) is list:
+            is_list = True
+            value_type = get_type_args(attr_type)[0]
+            if value_type is not int and not (
+                value_type is Self or is_subclass(value_type, RecordBase)
+            ):
+                raise ValueError(
+                    (
+                        "Unsupported field value type for model ref list: "
+                        f"{value_type}"
+                    ),
+                )
+        # The following is for a singular model ref value.
+        # Check if the model ref is optional, and if it is,
+        # determine the desired value for when the value is empty.
+        elif get_type_origin(attr_type) is Union:
+            unsupported_union = (
+                "Only unions of the format Optional[T], "
+                "Union[T, type(None)] or Union[T, Literal[False]] "
+                "are supported for singular model refs, "
+                f"found type hint: {attr_type}"
+            )
+            union_types = set(get_type_args(attr_type))
+            if len(union_types) > 2:  # noqa: PLR2004
+                raise ValueError(unsupported_union)
+            if type(None) in union_types:
+                union_types.remove(type(None))
+                optional = True
+                empty_value = None
+            elif Literal[False] in union_types:
+                union_types.remove(Literal[False])
+                optional = True
+                empty_value = False
+            if len(union_types) != 1:
+                raise ValueError(unsupported_union)
+            value_type = union_types.pop()
+        else:
+            value_type = attr_type
+        if (
+            not is_list
+            and value_type not in (int, str)
+            and not (value_type is Self or is_subclass(value_type, RecordBase))
+        ):
+            raise ValueError(
+                (
+                    "Unsupported field value type for singular model ref: "
+                    f"{value_type}"
+                ),
+            )
+        return cls(
+            model_ref=model_ref,
+            value_type=value_type,
+            record_class=(
+                record_class
+                if value_type is Self
+                else (
+                    value_type if is_subclass(value_type, RecordBase) else None
+                )
+            ),
+            is_list=is_list,
+            optional=optional,
+            empty_value=empty_value,
+        )
+
+
 class RecordBase(Generic[RecordManager]):
     """The generic base class for records.
 
@@ -139,6 +266,18 @@ class RecordBase(Generic[RecordManager]):
     Python source file, as the generic type argument.
     """
 
+    __slots__ = (
+        "__dict__",
+        "__weakref__",
+        "_client",
+        "_fields",
+        "_peers",
+        "_prefetched",
+        "_read_values",
+        "_record",
+        "_ref_values",
+    )
+
     id: int
     """The record's ID in Odoo."""
 
@@ -195,12 +334,107 @@ class RecordBase(Generic[RecordManager]):
     ) -> None:
         self._client = client
         """The Odoo client that created this record object."""
-        self._record = MappingProxyType(record)
+        self._record = (
+            record
+            if isinstance(record, MappingProxyType)
+            else MappingProxyType(record)
+        )
         """The raw record fields from OdooRPC."""
         self._fields = tuple(fields) if fields else None
         """The fields selected in the query that created this record object."""
-        self._values: Dict[str, Any] = {}
-        """The cache for the processed record field values."""
+        self._ref_values: Dict[str, Any] = {}
+        """The cache for the raw model ref field values, shared between
+        all model ref fields referencing the same Odoo field.
+        """
+        self._peers: Optional[List[ReferenceType[RecordBase]]] = None
+        """Weak references to the record objects created by the same query
+        as this record object (including this record object), if any.
+
+        When a model ref is resolved on this record object, it is also
+        resolved on the peer record objects at the same time.
+        """
+        self._prefetched: Optional[Set[str]] = None
+        """The model ref fields that have already been resolved
+        for this record object together with its peers.
+
+        Model refs that could not be resolved this way
+        are resolved separately for each record object,
+        instead of checking the peer record objects again.
+        """
+        self._read_values: Optional[Dict[str, Any]] = None
+        """Raw values for fields that were not selected when this record
+        object was fetched, read from Odoo on demand.
+        """
+
+    @classmethod
+    def _from_records(
+        cls,
+        client: ClientBase,
+        records: Iterable[Mapping[str, Any]],
+        fields: Optional[Sequence[str]],
+        peer_batch_size: int = 0,
+    ) -> List[Self]:
+        # Create record objects for a batch of raw records returned
+        # by a single query, sharing the selected fields between them.
+        # Unless the record class overrides the constructor,
+        # the attributes are set directly, to avoid the overhead
+        # of calling the constructor for every record.
+        _fields = tuple(fields) if fields else None
+        record_objs: List[Self]
+        if cls.__init__ is not RecordBase.__init__:
+            record_objs = [
+                cls(client=client, record=record, fields=_fields)
+                for record in records
+            ]
+        else:
+            record_objs = []
+            for record in records:
+                record_obj = object.__new__(cls)
+                record_obj._client = client
+                record_obj._record = MappingProxyType(record)
+                record_obj._fields = _fields
+                record_obj._ref_values = {}
+                record_obj._peers = None
+                record_obj._prefetched = None
+                record_obj._read_values = None
+                record_objs.append(record_obj)
+        # Record objects created by the same query are peers of each other,
+        # and resolve model refs together.
+        cls._set_peers(record_objs, peer_batch_size)
+        return record_objs
+
+    @staticmethod
+    def _set_peers(
+        records: Sequence[RecordBase],
+        batch_size: int,
+    ) -> None:
+        # Make the given record objects peers of each other.
+        # Large numbers of records are split into groups of consecutive
+        # records of at most the given size, so that resolving a model ref
+        # on one record only needs to check a bounded number of peers,
+        # rather than every record returned by the query.
+        if not records:
+            return
+        if not 0 < batch_size < len(records):
+            batch_size = len(records)
+        for i in range(0, len(records), batch_size):
+            batch = records[i : i + batch_size]
+            if len(batch) < 2:  # noqa: PLR2004
+                batch[0]._peers = None
+                continue
+            peers: List[ReferenceType[RecordBase]] = [
+                ref(record) for record in batch
+            ]
+            for record in batch:
+                record._peers = peers
+
+    def _get_peers(self) -> List[RecordBase]:
+        # Return the peer record objects that are still in use,
+        # including this record object.
+        if not self._peers:
+            return [self]
+        peers = [peer() for peer in self._peers]
+        return [peer for peer in peers if peer is not None]
 
     @property
     def _manager(self) -> RecordManager:
@@ -236,11 +470,16 @@ class RecordBase(Generic[RecordManager]):
         :return: Record object of the implementing class's type
         :rtype: Self
         """
-        return cls(
+        new_record_obj = cls(
             client=record_obj._client,
             record=record_obj._record,
             fields=record_obj._fields,
         )
+        # The raw model ref values are derived from the (read-only)
+        # raw record, so they can be shared with the new record object.
+        new_record_obj._ref_values = record_obj._ref_values
+        new_record_obj._read_values = record_obj._read_values
+        return new_record_obj
 
     def as_dict(self, raw: bool = False) -> Dict[str, Any]:
         """Convert this record object to a dictionary.
@@ -268,23 +507,92 @@ class RecordBase(Generic[RecordManager]):
             }
         )
 
+    def as_flat_dict(self) -> Dict[str, Any]:
+        """Convert this record object to a flat dictionary.
+
+        This is the same as ``as_dict``, except model refs are
+        decoded into the ID and name fields defined on the record class,
+        instead of being returned as the raw ``[id, name]`` values
+        returned by OdooRPC. For example, the ``parent_id`` model ref
+        on partners is returned as the ``parent_id`` (record ID)
+        and ``parent_name`` (record name) fields.
+
+        All fields are decoded in a single pass over the record,
+        which is faster than accessing each field individually.
+
+        :return: Flat record dictionary
+        :rtype: Dict[str, Any]
+        """
+        manager = self._manager
+        ref_value_fields = manager._model_ref_value_fields
+        flat_dict: Dict[str, Any] = {}
+        for field, value in self._record.items():
+            local_field = get_mapped_field(
+                field_mapping=manager._field_mapping_reverse,
+                odoo_version=self._odoo.version,
+                field=field,
+            )
+            if local_field not in ref_value_fields:
+                flat_dict[manager._get_local_field(field)] = (
+                    copy.deepcopy(value)
+                    if isinstance(value, (dict, list))
+                    else value
+                )
+                continue
+            for ref_local_field, ref_field in ref_value_fields[local_field]:
+                if ref_field.is_list:
+                    flat_dict[ref_local_field] = list(value)
+                elif not value:
+                    flat_dict[ref_local_field] = ref_field.empty_value
+                elif ref_field.value_type is int:
+                    flat_dict[ref_local_field] = value[0]
+                else:
+                    flat_dict[ref_local_field] = value[1]
+        return flat_dict
+
     def refresh(self) -> Self:
         """Fetch the latest version of this record from Odoo.
 
         This does not update the record object in place,
         a new object is returned with the up-to-date field values.
+        If this record object is in the record cache, the new object
+        replaces it, so that model refs resolved on other record objects
+        from then on return the latest version.
 
+        :raises RecordNotFoundError: If the record no longer exists
         :return: Latest version of the record object
         :rtype: Self
         """
-        return type(self)(
-            client=self._client,
-            record=self._env.read(
-                self.id,
-                fields=self._fields,
-            )[0],
-            fields=self._fields,
+        manager = self._manager
+        # Cached record objects were fetched with the default set of fields,
+        # so fetch the default set of fields again to replace it.
+        fields = (
+            None
+            if manager._record_cache.get(self.id) is self
+            else self._fields
         )
+        return manager.list(  # type: ignore[return-value]
+            self.id,
+            fields=fields,
+        )[0]
+
+    def prefetch(self, *fields: str, max_workers: int = 1) -> None:
+        """Fetch the records referenced by the given model ref fields
+        on this record, using one request per referenced model.
+
+        The fetched records are cached on this record object,
+        so that subsequent accesses do not need to query Odoo.
+
+        Set ``max_workers`` to a value greater than 1 to make
+        the requests for multiple models concurrently.
+
+        :param fields: The model ref fields to prefetch
+        :type fields: str
+        :param max_workers: Concurrent requests to make, defaults to ``1``
+        :type max_workers: int, optional
+        :raises ValueError: If a field is not a model ref field
+        """
+        self._manager.prefetch([self], fields, max_workers=max_workers)
 
     def unlink(self) -> None:
         """Delete this record from Odoo."""
@@ -301,124 +609,125 @@ class RecordBase(Generic[RecordManager]):
         return self._manager._get_local_field(field)
 
     def _get_field(self, name: str) -> Any:
+        remote_field = self._get_remote_field(name)
         try:
-            return self._record[self._get_remote_field(name)]
+            return self._record[remote_field]
         except KeyError as err:
-            raise AttributeError(str(err)) from None
+            # Fields defined on the record class that were not selected
+            # when this record was fetched are read on demand.
+            if name not in self._manager._record_type_hints:
+                raise AttributeError(str(err)) from None
+            return self._read_field(remote_field)
 
     def __getattr__(self, name: str) -> Any:
-        # If the field value has already been decoded,
-        # return the cached value.
-        if name in self._values:
-            return self._values[name]
-        # NOTE(callumdickinson): Use the type hint to coerce
-        # the field value returned in the record dict into the expected type.
-        # First, check if the field has a type hint defined at all.
-        # If not, just cache the value as is and return it.
-        if name not in self._type_hints:
-            self._values[name] = self._get_field(name)
-            return self._values[name]
-        # We know we have a type hint to decode for the field.
-        type_hint = self._type_hints[name]
-        # If this field is a field alias, recursively fetch
-        # the value for the target field.
-        field_alias = FieldAlias.get(type_hint)
-        if field_alias:
-            self._values[name] = getattr(self, field_alias.field)
-            return self._values[name]
-        # If this field is a model ref, resolve the model ref
-        # and return the intended value.
-        model_ref = ModelRef.get(type_hint)
-        if model_ref:
-            self._values[name] = self._getattr_model_ref(
-                attr_type=get_type_args(type_hint)[0],
-                model_ref=model_ref,
-            )
-            return self._values[name]
-        # Base case: Decode the value according to the field's type hint,
-        # cache the value, and return it.
-        self._values[name] = self._decode_value(
-            type_hint,
-            self._get_field(name),
-        )
-        return self._values[name]
+        # Decoded field values are cached in the instance dictionary,
+        # so this method is only called the first time a field is accessed.
+        # Subsequent accesses are handled natively by the attribute lookup.
+        # The manager provides functions for decoding every field
+        # that has a type hint defined on the record class.
+        # If a field has no type hint, cache the raw value as is.
+        getter = self._manager._field_getters.get(name)
+        value = getter(self) if getter else self._get_field(name)
+        self.__dict__[name] = value
+        return value
 
     def _getattr_model_ref(
         self,
-        attr_type: Type[Any],
-        model_ref: ModelRef,
+        ref_field: ModelRefField,
+        ref_records: Optional[Mapping[int, RecordBase]] = None,
     ) -> Any:
-        field_value = self._record[self._get_remote_field(model_ref.field)]
+        # If referenced records have already been fetched
+        # (e.g. when prefetching model refs for multiple records),
+        # they are taken from ref_records instead of being fetched from Odoo.
+        # A KeyError is raised if a referenced record is not available.
+        field_value = self._get_ref_value(ref_field.model_ref.field)
         # If the expected attribute type is a list, then process the model ref
         # as a list of model IDs or objects.
-        if get_type_origin(attr_type) is list:
-            value_type = get_type_args(attr_type)[0]
-            # Handle a model ref list with the same record type as the
-            # parent record. Fetch the records from Odoo, and return
-            # the results.
-            if value_type is Self:
-                return self._manager.list(field_value)
-            # List of model objects. Fetch the objects from Odoo,
-            # and return the results.
-            if is_subclass(value_type, RecordBase):
-                return self._client._record_manager_mapping[value_type].list(
-                    field_value,
-                )
+        if ref_field.is_list:
             # List of model IDs. The raw field value is already this format,
             # so just return it as is.
-            if value_type is int:
+            if not ref_field.record_class:
                 return field_value
-            raise ValueError(
-                (
-                    "Unsupported field value type for model ref list: "
-                    f"{value_type}"
-                ),
-            )
+            # List of model objects. Fetch the objects from Odoo,
+            # and return the results.
+            if ref_records is not None:
+                return [ref_records[record_id] for record_id in field_value]
+            return self._client._record_manager_mapping[
+                ref_field.record_class
+            ]._list_cached(field_value)
         # The following is for decoding a singular model ref value.
         # Check if the model ref is optional, and if it is,
         # return the desired value for when the value is empty.
-        if get_type_origin(attr_type) is Union:
-            unsupported_union = (
-                "Only unions of the format Optional[T], "
-                "Union[T, type(None)] or Union[T, Literal[False]] "
-                "are supported for singular model refs, "
-                f"found type hint: {attr_type}"
-            )
-            union_types = set(get_type_args(attr_type))
-            if len(union_types) > 2:  # noqa: PLR2004
-                raise ValueError(unsupported_union)
-            if type(None) in union_types:
-                union_types.remove(type(None))
-                if not field_value:
-                    return None
-            elif Literal[False] in union_types:
-                union_types.remove(Literal[False])
-                if not field_value:
-                    return False
-            if len(union_types) != 1:
-                raise ValueError(unsupported_union)
-            value_type = union_types.pop()
-        else:
-            value_type = attr_type
+        if ref_field.optional and not field_value:
+            return ref_field.empty_value
         # The model ref is either required, or is optional but a value
-        # was found. Determine the appropriate value return type,
-        # and generate the value.
+        # was found. Generate the value for the appropriate return type.
         record_id: int = field_value[0]
-        record_name: str = field_value[1]
-        if value_type is Self:
-            return self._manager.get(record_id)
-        if is_subclass(value_type, RecordBase):
-            return self._client._record_manager_mapping[value_type].get(
-                record_id,
-            )
-        if value_type is int:
+        if ref_field.record_class:
+            if ref_records is not None:
+                return ref_records[record_id]
+            return self._client._record_manager_mapping[
+                ref_field.record_class
+            ]._get_cached(record_id)
+        if ref_field.value_type is int:
             return record_id
-        if value_type is str:
-            return record_name
-        raise ValueError(
+        record_name: str = field_value[1]
+        return record_name
+
+    def _get_ref_value(self, field: str) -> Any:
+        # The ID, name and record object fields for a model ref
+        # all decode the same raw value, so look it up only once.
+        try:
+            return self._ref_values[field]
+        except KeyError:
+            remote_field = self._get_remote_field(field)
+            try:
+                value = self._record[remote_field]
+            except KeyError:
+                value = self._read_field(remote_field)
+            self._ref_values[field] = value
+            return value
+
+    def _read_field(self, remote_field: str) -> Any:
+        # If only some fields were selected when this record was fetched,
+        # read the value for a field that was not selected from Odoo,
+        # selecting only that field.
+        # The field is read for all peer record objects at the same time,
+        # as they were fetched with the same fields selected.
+        # If all fields were selected, the field does not exist
+        # on the Odoo server.
+        if self._fields is not None:
+            if self._read_values and remote_field in self._read_values:
+                return self._read_values[remote_field]
+            peers = {
+                peer.id: peer
+                for peer in self._get_peers()
+                if not (
+                    peer._read_values and remote_field in peer._read_values
+                )
+            }
+            peers[self.id] = self
+            ids = list(peers.keys())
+            batch_size = self._manager.read_batch_size
+            if not 0 < batch_size < len(ids):
+                batch_size = len(ids)
+            for i in range(0, len(ids), batch_size):
+                for record in self._env.read(
+                    ids[i : i + batch_size],
+                    fields=[remote_field],
+                ):
+                    if remote_field not in record:
+                        continue
+                    peer = peers[record["id"]]
+                    if peer._read_values is None:
+                        peer._read_values = {}
+                    peer._read_values[remote_field] = record[remote_field]
+            if self._read_values and remote_field in self._read_values:
+                return self._read_values[remote_field]
+        raise AttributeError(
             (
-                "Unsupported field value type for singular model ref: "
-                f"{value_type}"
+                f"Field '{remote_field}' not found on "
+                f"{type(self).__name__} record with ID {self.id}"
             ),
         )
 
@@ -15,11 +15,18 @@
 
 from __future__ import annotations
 
+import threading
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from datetime import date, datetime
+from functools import partial
 from types import MappingProxyType
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Dict,
     Generic,
     Iterable,
@@ -35,6 +42,7 @@ from typing import (
     Union,
     overload,
 )
+from weakref import WeakKeyDictionary, WeakValueDictionary
 
 from typing_extensions import (
     Annotated,
@@ -50,7 +58,7 @@ from ..util import (
     DEFAULT_SERVER_DATETIME_FORMAT,
     get_mapped_field,
 )
-from .record import FieldAlias, ModelRef, RecordBase
+from .record import FieldAlias, ModelRef, ModelRefField, RecordBase
 
 if TYPE_CHECKING:
     from odoorpc import ODOO  # type: ignore[import]
@@ -61,6 +69,23 @@ if TYPE_CHECKING:
 Record = TypeVar("Record", bound=RecordBase)
 FilterCriterion = Union[Tuple[str, str, Any], Sequence[Any], str]
 
+_RECORD_CLASS_ATTRS = (
+    "_record_type_hints",
+    "_field_aliases",
+    "_model_ref_fields",
+    "_model_ref_mapping",
+    "_model_ref_value_fields",
+    "_field_getters",
+)
+"""The manager attributes generated by parsing the record class."""
+
+_parsed_record_classes: WeakKeyDictionary[type, Dict[str, Any]] = (
+    WeakKeyDictionary()
+)
+"""The parsed record class attributes for each record manager class,
+shared between all managers of the same type.
+"""
+
 
 class RecordManagerBase(Generic[Record]):
     """A generic record manager base class.
@@ -107,19 +132,40 @@ class RecordManagerBase(Generic[Record]):
     By default, all fields on the model will be fetched.
     """
 
+    read_batch_size: int = 1000
+    """The maximum number of records to read from Odoo in a single request.
+
+    Queries for more records than this are split into multiple requests.
+    Set to ``0`` to always read all records in a single request.
+    """
+
+    prefetch_batch_size: int = 1000
+    """The maximum number of record objects returned by a query
+    that resolve model refs together.
+
+    When a model ref is accessed on a record object, it is resolved
+    for up to this many neighbouring records returned by the same query,
+    so that iterating over a large number of records makes
+    one request per batch of records.
+    Set to ``0`` to resolve model refs for all records returned by a query.
+    """
+
+    record_cache_size: int = 0
+    """The number of most recently used record objects the manager
+    keeps in the record cache, even when they are no longer in use
+    by the application.
+
+    Cached record objects are not refreshed when the records change
+    in Odoo, so by default, record objects are only cached
+    while they are still in use.
+    """
+
     def __init__(self, client: ClientBase) -> None:
         self._client = client
         """The Odoo client object the manager uses."""
         # Assign this record manager object as the manager
         # responsible for the configured record class in the client.
         self._client._record_manager_mapping[self.record_class] = self
-        self._record_type_hints = MappingProxyType(
-            get_type_hints(
-                self.record_class,
-                include_extras=True,
-            ),
-        )
-        """The type hints for the fields defined in the record class."""
         self._field_mapping_reverse = {
             odoo_version: {
                 remote_field: local_field
@@ -133,7 +179,96 @@ class RecordManagerBase(Generic[Record]):
         record class, mapping Odoo version-specific remote field names
         to their representations on the record class.
         """
-        self._model_ref_mapping: Dict[str, str] = {}
+        self._record_cache: WeakValueDictionary[int, Record] = (
+            WeakValueDictionary()
+        )
+        """Cache of record objects fetched by this manager with the
+        default set of fields, indexed by record ID.
+
+        This is used to avoid fetching the same record more than once
+        when resolving model refs on record objects.
+
+        Record objects are weakly referenced, so they are only kept
+        in the cache while they are still in use by the application,
+        to avoid the cache growing indefinitely in long-lived processes.
+        """
+        self._recent_records: OrderedDict[int, Record] = OrderedDict()
+        """The most recently used record objects in the record cache,
+        kept alive even when not in use, up to ``record_cache_size``
+        record objects.
+        """
+        self._cache_lock = threading.RLock()
+        """Lock guarding the record cache, so that it can be used
+        by multiple threads at the same time.
+        """
+        self._pending_fetches: Dict[int, threading.Event] = {}
+        """Records currently being fetched to populate the record cache,
+        indexed by record ID.
+
+        Threads requesting a record that is already being fetched
+        wait for that fetch to complete, instead of fetching it again.
+        """
+
+    def __getattr__(self, name: str) -> Any:
+        # Resolving the type hints for a record class is expensive,
+        # and a client creates managers for every record type,
+        # most of which are never used by the application.
+        # Defer parsing the record class until the first time the
+        # type hint derived attributes are accessed, and set them
+        # on the manager object so this is only called once.
+        if name in _RECORD_CLASS_ATTRS:
+            self._parse_record_class()
+            return self.__dict__[name]
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'",
+        )
+
+    def _parse_record_class(self) -> None:
+        # The result of parsing the record class is the same for every
+        # manager of the same type, so it only needs to be done once,
+        # and can be shared between managers on different clients.
+        parsed = _parsed_record_classes.get(type(self))
+        if parsed is not None:
+            self.__dict__.update(parsed)
+            return
+        self._record_type_hints = MappingProxyType(
+            get_type_hints(
+                self.record_class,
+                include_extras=True,
+            ),
+        )
+        """The type hints for the fields defined in the record class."""
+        field_aliases: Dict[str, str] = {}
+        for local_field in self._record_type_hints.keys():
+            try:
+                field_aliases[local_field] = self._resolve_alias_chain(
+                    local_field,
+                )
+            except ValueError:
+                # Recursive field aliases are not added to the table,
+                # so an error is raised when they are used.
+                pass
+        self._field_aliases = field_aliases
+        """Pre-resolved mapping of every field defined in the record class
+        to its target field, after resolving field aliases.
+        Fields that are not aliases are mapped to themselves.
+        """
+        model_ref_fields: Dict[str, ModelRefField] = {}
+        model_ref_mapping: Dict[str, str] = {}
+        for local_field, type_hint in self._record_type_hints.items():
+            ref_field = ModelRefField.from_type_hint(
+                type_hint,
+                self.record_class,
+            )
+            if ref_field:
+                model_ref_fields[local_field] = ref_field
+                if ref_field.value_type is int and not ref_field.optional:
+                    model_ref_mapping[ref_field.model_ref.field] = local_field
+        self._model_ref_fields = model_ref_fields
+        """Pre-parsed information for the model ref fields
+        defined in the record class.
+        """
+        self._model_ref_mapping = model_ref_mapping
         """Mapping of the remote field name for a model ref
         to the local field name representing the model ref's IDs.
 
@@ -143,18 +278,112 @@ class RecordManagerBase(Generic[Record]):
         * (remote) ``child_id`` -> ``child_ids`` (local)
         * (remote) ``os_project`` -> ``os_project_id`` (local)
         """
-        for local_field, type_hint in self._record_type_hints.items():
-            model_ref = ModelRef.get(type_hint)
-            if model_ref:
-                field_type = get_type_args(type_hint)[0]
-                try:
-                    if field_type is int or (
-                        get_type_origin(field_type) is list
-                        and get_type_args(field_type)[0] is int
-                    ):
-                        self._model_ref_mapping[model_ref.field] = local_field
-                except IndexError:
-                    pass
+        model_ref_value_fields: Dict[str, List[Tuple[str, ModelRefField]]] = {}
+        for local_field, ref_field in model_ref_fields.items():
+            if not ref_field.record_class:
+                model_ref_value_fields.setdefault(
+                    ref_field.model_ref.field,
+                    [],
+                ).append((local_field, ref_field))
+        self._model_ref_value_fields = model_ref_value_fields
+        """Mapping of the field name for a model ref to the local fields
+        representing the model ref's IDs and names.
+
+        Examples:
+
+        * ``parent_id`` -> ``parent_id``, ``parent_name``
+        * ``os_projects`` -> ``os_project_ids``
+        """
+        self._field_getters = {
+            local_field: self._get_field_getter(local_field, type_hint)
+            for local_field, type_hint in self._record_type_hints.items()
+        }
+        """Functions for decoding the value of each field
+        defined in the record class from a record object.
+        """
+        _parsed_record_classes[type(self)] = {
+            attr: self.__dict__[attr] for attr in _RECORD_CLASS_ATTRS
+        }
+
+    def _get_field_getter(
+        self,
+        field: str,
+        type_hint: Any,
+    ) -> Callable[[Record], Any]:
+        # Generate a function specialised for decoding the given field,
+        # so that the type hint does not need to be parsed again
+        # every time the field is accessed on a record object.
+        # If this field is a field alias, fetch the value
+        # for the target field.
+        field_alias = FieldAlias.get(type_hint)
+        if field_alias:
+            target_field = field_alias.field
+            return lambda record: getattr(record, target_field)
+        # If this field is a model ref, resolve the model ref
+        # and return the intended value.
+        ref_field = self._model_ref_fields.get(field)
+        if ref_field:
+            return self._get_model_ref_getter(field, ref_field)
+        # If the value needs to be decoded according to the field's
+        # type hint, do so. Otherwise, return the raw value as is.
+        value_type = get_type_origin(type_hint) or type_hint
+        if value_type in (date, datetime, list, dict, Union):
+            return lambda record: record._decode_value(
+                type_hint,
+                record._get_field(field),
+            )
+        return lambda record: record._get_field(field)
+
+    def _get_model_ref_getter(
+        self,
+        local_field: str,
+        ref_field: ModelRefField,
+    ) -> Callable[[Record], Any]:
+        # Model refs that return record objects need to fetch
+        # the referenced records from Odoo (or the record cache),
+        # so are handled by the record object.
+        # The model ref is resolved for all peer records created by
+        # the same query at once or, within a prefetch scope,
+        # for the records of the same type fetched in the scope.
+        # Each record is only checked once for a given model ref,
+        # so unresolved model refs do not cause the peers to be rescanned.
+        if ref_field.record_class:
+
+            def record_getter(record: Record) -> Any:
+                if record._peers and not (
+                    record._prefetched and local_field in record._prefetched
+                ):
+                    peers = record._get_peers()
+                    record._manager.prefetch(peers, [local_field])
+                    for peer in peers:
+                        if peer._prefetched is None:
+                            peer._prefetched = set()
+                        peer._prefetched.add(local_field)
+                    try:
+                        return record.__dict__[local_field]
+                    except KeyError:
+                        pass
+                return record._getattr_model_ref(ref_field)
+
+            return record_getter
+        field = ref_field.model_ref.field
+        # List of model IDs. The raw field value is already this format,
+        # so just return it as is.
+        if ref_field.is_list:
+            return lambda record: record._get_ref_value(field)
+        # Singular model ref IDs and names are taken from the
+        # raw [id, name] value. Only optional model refs need to check
+        # for an empty value.
+        index = 0 if ref_field.value_type is int else 1
+        if ref_field.optional:
+            empty_value = ref_field.empty_value
+
+            def getter(record: Record) -> Any:
+                value = record._get_ref_value(field)
+                return value[index] if value else empty_value
+
+            return getter
+        return lambda record: record._get_ref_value(field)[index]
 
     @property
     def _odoo(self) -> ODOO:
@@ -174,6 +403,7 @@ class RecordManagerBase(Generic[Record]):
         fields: Optional[Iterable[str]] = ...,
         as_dict: Literal[False] = ...,
         optional: bool = ...,
+        prefetch: Optional[Iterable[str]] = ...,
     ) -> List[Record]: ...
 
     @overload
@@ -184,6 +414,7 @@ class RecordManagerBase(Generic[Record]):
         fields: Optional[Iterable[str]] = ...,
         as_dict: Literal[True],
         optional: bool = ...,
+        prefetch: Optional[Iterable[str]] = ...,
     ) -> List[Dict[str, Any]]: ...
 
     @overload
@@ -194,6 +425,7 @@ class RecordManagerBase(Generic[Record]):
         fields: Optional[Iterable[str]] = ...,
         as_dict: bool = ...,
         optional: bool = ...,
+        prefetch: Optional[Iterable[str]] = ...,
     ) -> Union[List[Record], List[Dict[str, Any]]]: ...
 
     def list(
@@ -202,6 +434,7 @@ class RecordManagerBase(Generic[Record]):
         fields: Optional[Iterable[str]] = None,
         as_dict: bool = False,
         optional: bool = False,
+        prefetch: Optional[Iterable[str]] = None,
     ) -> Union[List[Record], List[Dict[str, Any]]]:
         """Get one or more specific records by ID.
 
@@ -221,6 +454,18 @@ class RecordManagerBase(Generic[Record]):
         If ``ids`` is given an empty iterator, this method
         returns an empty list.
 
+        Model refs to other records can be fetched in bulk for all
+        returned records by passing the names of the model ref fields
+        to ``prefetch``. For more information, see the ``prefetch`` method.
+        This has no effect when ``as_dict`` is ``True``.
+
+        Nested field references can be specified in ``fields`` using
+        the dot-notation (``.``), to select fields on records referenced
+        by model refs. The model ref field is selected on the returned
+        records, and the referenced records are prefetched with the
+        nested fields selected. Nested field references cannot be used
+        when ``as_dict`` is ``True``.
+
         :param ids: Record ID, or list of record IDs
         :type ids: Union[int, Iterable[int]]
         :param fields: Fields to select, defaults to ``None`` (select all)
@@ -229,7 +474,10 @@ class RecordManagerBase(Generic[Record]):
         :type as_dict: bool, optional
         :param optional: Disable missing record errors, defaults to ``False``
         :type optional: bool, optional
+        :param prefetch: Model refs to fetch in bulk, defaults to ``None``
+        :type prefetch: Optional[Iterable[str]], optional
         :raises RecordNotFoundError: If IDs are required but some are missing
+        :raises ValueError: If nested fields are selected with ``as_dict``
         :return: List of records
         :rtype: list[Record] or list[dict[str, Any]]
         """
@@ -239,37 +487,39 @@ class RecordManagerBase(Generic[Record]):
             _ids = list(ids)
             if not _ids:
                 return []  # type: ignore[return-value]
-        fields = fields or self.default_fields or None
-        _fields = (
-            list(
-                dict.fromkeys(
-                    (self._encode_field(f) for f in fields),
-                ).keys(),
-            )
-            if fields is not None
-            else None
+        fields_selected = bool(fields)
+        _fields, nested_fields = self._encode_read_fields(
+            fields,
+            as_dict=as_dict,
         )
-        records: Iterable[Dict[str, Any]] = self._env.read(
-            _ids,
-            fields=_fields,
-        )
-        if as_dict:
-            res_dicts = [
-                {
-                    self._get_local_field(field): value
-                    for field, value in record_dict.items()
-                }
-                for record_dict in records
-            ]
+        if nested_fields:
+            prefetch = [*(prefetch or ()), *nested_fields]
+        # Large numbers of records are read in batches,
+        # to keep the size of each request and response bounded.
+        batch_size = self.read_batch_size
+        if isinstance(_ids, int) or not 0 < batch_size < len(_ids):
+            records: Iterable[Dict[str, Any]] = self._env.read(
+                _ids,
+                fields=_fields,
+            )
         else:
-            res_objs = [
-                self.record_class(
-                    client=self._client,
-                    record=record,
+            records = [
+                record
+                for i in range(0, len(_ids), batch_size)
+                for record in self._env.read(
+                    _ids[i : i + batch_size],
                     fields=_fields,
                 )
-                for record in records
             ]
+        if as_dict:
+            res_dicts = self._decode_record_dicts(records)
+        else:
+            res_objs = self.record_class._from_records(
+                client=self._client,
+                records=records,
+                fields=_fields,
+                peer_batch_size=self.prefetch_batch_size,
+            )
         if not optional:
             required_ids = {_ids} if isinstance(_ids, int) else set(_ids)
             found_ids: Set[int] = (
@@ -286,12 +536,275 @@ class RecordManagerBase(Generic[Record]):
                         f"{', '.join(str(i) for i in sorted(missing_ids))}"
                     ),
                 )
-        return res_dicts if as_dict else res_objs
+        if as_dict:
+            return res_dicts
+        # Record objects fetched with the default set of fields
+        # are stored in the cache, for use when resolving model refs.
+        # If a prefetch scope is active, the record objects are kept alive
+        # until the scope exits, and are made peers of the other
+        # record objects of the same type fetched in the scope,
+        # in groups of up to the prefetch batch size.
+        if not fields_selected:
+            for record in res_objs:
+                self._cache_record(record)
+            scope = self._client._prefetch_scope
+            if scope is not None:
+                scope_records = scope.setdefault(self.record_class, [])
+                batch_size = self.prefetch_batch_size
+                start = (
+                    len(scope_records) - len(scope_records) % batch_size
+                    if batch_size > 0
+                    else 0
+                )
+                scope_records.extend(res_objs)
+                self.record_class._set_peers(
+                    scope_records[start:],
+                    batch_size,
+                )
+        if prefetch:
+            self.prefetch(res_objs, prefetch)
+        return res_objs
+
+    def _encode_read_fields(
+        self,
+        fields: Optional[Iterable[str]],
+        as_dict: bool = False,
+    ) -> Tuple[Optional[List[str]], List[str]]:
+        # Return the remote field names to read for the given fields
+        # (or the default fields), and any nested field references.
+        fields = fields or self.default_fields or None
+        if fields is None:
+            return (None, [])
+        # Nested field references (e.g. ``parent.name``) select
+        # the model ref field on this record, and the referenced
+        # records are prefetched with the nested fields selected.
+        fields = list(fields)
+        nested_fields = [f for f in fields if "." in f]
+        if nested_fields:
+            # Referenced records are not included in record dictionaries,
+            # so the nested fields would otherwise be silently dropped.
+            if as_dict:
+                raise ValueError(
+                    (
+                        "Nested field references are not supported "
+                        "when returning records as dictionaries: "
+                        f"{', '.join(nested_fields)}"
+                    ),
+                )
+            fields = [f.partition(".")[0] for f in fields]
+        return (
+            list(dict.fromkeys(self._encode_field(f) for f in fields)),
+            nested_fields,
+        )
+
+    def _decode_record_dicts(
+        self,
+        records: Iterable[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        # All records returned by the query have the same fields,
+        # so map the remote field names to local field names once,
+        # instead of once per record.
+        res_dicts: List[Dict[str, Any]] = []
+        local_fields: Dict[str, str] = {}
+        for record_dict in records:
+            if record_dict.keys() != local_fields.keys():
+                local_fields = {
+                    field: self._get_local_field(field)
+                    for field in record_dict.keys()
+                }
+            res_dicts.append(
+                {
+                    local_fields[field]: value
+                    for field, value in record_dict.items()
+                },
+            )
+        return res_dicts
+
+    def prefetch(
+        self,
+        records: Iterable[Record],
+        fields: Iterable[str],
+        max_workers: int = 1,
+    ) -> None:
+        """Fetch the records referenced by the given model ref fields
+        for a collection of records, in bulk.
+
+        Normally, every record object fetches its own referenced records
+        from Odoo the first time a model ref field is accessed,
+        which results in one request per record when iterating
+        over a collection of records.
+
+        This method instead collects the referenced record IDs across
+        all of the given records, fetches them using one request
+        per referenced model, and caches the results on each record object,
+        so that subsequent accesses do not need to query Odoo.
+
+        Model ref fields can be specified using the field name for
+        the record object(s), the record ID(s), or field aliases.
+        All model ref fields referencing the same Odoo field
+        are populated.
+
+        Referenced records that could not be found are not cached,
+        and will instead be fetched when the field is accessed.
+
+        By default, the referenced records are fetched with all fields
+        selected. To only select specific fields on the referenced records,
+        specify nested field references using the dot-notation (``.``).
+        Nested field references can themselves reference model refs
+        on the referenced records, in which case those records
+        are also prefetched.
+
+        By default, the requests for each referenced model are made
+        one after the other. Set ``max_workers`` to a value greater than 1
+        to make the requests for up to that many models concurrently,
+        using a thread pool.
+
+        :param records: The records to fetch references for
+        :type records: Iterable[Record]
+        :param fields: The model ref fields to prefetch
+        :type fields: Iterable[str]
+        :param max_workers: Concurrent requests to make, defaults to ``1``
+        :type max_workers: int, optional
+        :raises ValueError: If a field is not a model ref field
+        """
+        records = list(records)
+        if not records:
+            return
+        # Find all of the local fields for the given model refs that
+        # return record objects. These are the fields that will
+        # be populated with the prefetched records.
+        # Nested field references (e.g. ``parent.name``) are used to
+        # select the fields to fetch on the referenced records.
+        # If a model ref is specified without a nested field reference,
+        # the default set of fields is selected.
+        target_fields: Dict[str, ModelRefField] = {}
+        ref_fields: Dict[Type[RecordBase], Optional[Dict[str, None]]] = {}
+        nested_fields: Dict[Type[RecordBase], Dict[str, None]] = {}
+        for field_ref in fields:
+            field, _, sub_field = field_ref.partition(".")
+            local_field = self._resolve_alias(field)
+            if local_field not in self._model_ref_fields:
+                raise ValueError(
+                    (
+                        f"Field '{field}' on {self.record_class.__name__} "
+                        "is not a model ref field, unable to prefetch"
+                    ),
+                )
+            model_ref = self._model_ref_fields[local_field].model_ref
+            for target_field, ref_field in self._model_ref_fields.items():
+                if (
+                    ref_field.model_ref.field != model_ref.field
+                    or not ref_field.record_class
+                ):
+                    continue
+                target_fields[target_field] = ref_field
+                record_class = ref_field.record_class
+                if not sub_field:
+                    ref_fields[record_class] = None
+                    continue
+                if "." in sub_field:
+                    nested_fields.setdefault(record_class, {})[sub_field] = (
+                        None
+                    )
+                if record_class not in ref_fields:
+                    ref_fields[record_class] = {}
+                selected_fields = ref_fields[record_class]
+                if selected_fields is not None:
+                    selected_fields[sub_field] = None
+        # Collect the referenced IDs across all records,
+        # grouped by the record class of the referenced records,
+        # so that only one request is made per referenced model.
+        ids: Dict[Type[RecordBase], Dict[int, None]] = {}
+        for target_field, ref_field in target_fields.items():
+            record_ids = ids.setdefault(
+                ref_field.record_class,  # type: ignore[arg-type]
+                {},
+            )
+            remote_field = self._get_remote_field(ref_field.model_ref.field)
+            for record in records:
+                if target_field in record.__dict__:
+                    continue
+                value = record._record.get(remote_field)
+                if not value:
+                    continue
+                if ref_field.is_list:
+                    record_ids.update(dict.fromkeys(value))
+                else:
+                    record_ids[value[0]] = None
+        # The requests for each referenced model are independent,
+        # so they can optionally be made concurrently.
+        # Each request is run in a copy of the current context,
+        # so that any active prefetch scope still applies.
+        record_classes = [
+            record_class
+            for record_class, record_ids in ids.items()
+            if record_ids
+        ]
+        requests = [
+            partial(
+                self._prefetch_model,
+                record_class=record_class,
+                ids=ids[record_class],
+                fields=ref_fields[record_class],
+                nested_fields=nested_fields.get(record_class),
+                max_workers=max_workers,
+            )
+            for record_class in record_classes
+        ]
+        if max_workers > 1 and len(requests) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(requests)),
+            ) as executor:
+                futures = [
+                    executor.submit(copy_context().run, request)
+                    for request in requests
+                ]
+                fetched = [future.result() for future in futures]
+        else:
+            fetched = [request() for request in requests]
+        ref_records: Dict[Type[RecordBase], Dict[int, RecordBase]] = {
+            record_class: {
+                ref_record.id: ref_record for ref_record in fetched_records
+            }
+            for record_class, fetched_records in zip(record_classes, fetched)
+        }
+        # Populate the cached values on each record, skipping any
+        # records referencing records that were not found.
+        for record in records:
+            for target_field, ref_field in target_fields.items():
+                if target_field in record.__dict__:
+                    continue
+                try:
+                    record.__dict__[target_field] = record._getattr_model_ref(
+                        ref_field=ref_field,
+                        ref_records=ref_records.get(
+                            ref_field.record_class,  # type: ignore[arg-type]
+                            {},
+                        ),
+                    )
+                except KeyError:
+                    pass
+
+    def _prefetch_model(
+        self,
+        record_class: Type[RecordBase],
+        ids: Iterable[int],
+        fields: Optional[Iterable[str]],
+        nested_fields: Optional[Iterable[str]],
+        max_workers: int,
+    ) -> List[RecordBase]:
+        # Fetch the referenced records for a single model,
+        # and prefetch any nested model refs on the fetched records.
+        manager = self._client._record_manager_mapping[record_class]
+        records = manager._list_cached(ids, fields=fields, optional=True)
+        if nested_fields:
+            manager.prefetch(records, nested_fields, max_workers=max_workers)
+        return records
 
     @overload
     def get(
         self,
-        id: int,  # noqa: A002
+        id: int,
         *,
         fields: Optional[Iterable[str]] = ...,
         as_dict: Literal[False] = ...,
@@ -301,7 +814,7 @@ class RecordManagerBase(Generic[Record]):
     @overload
     def get(
         self,
-        id: int,  # noqa: A002
+        id: int,
         *,
         fields: Optional[Iterable[str]] = ...,
         as_dict: Literal[True],
@@ -311,7 +824,7 @@ class RecordManagerBase(Generic[Record]):
     @overload
     def get(
         self,
-        id: int,  # noqa: A002
+        id: int,
         *,
         fields: Optional[Iterable[str]] = ...,
         as_dict: Literal[False] = ...,
@@ -321,7 +834,7 @@ class RecordManagerBase(Generic[Record]):
     @overload
     def get(
         self,
-        id: int,  # noqa: A002
+        id: int,
         *,
         fields: Optional[Iterable[str]] = ...,
         as_dict: Literal[True],
@@ -331,7 +844,7 @@ class RecordManagerBase(Generic[Record]):
     @overload
     def get(
         self,
-        id: int,  # noqa: A002
+        id: int,
         *,
         fields: Optional[Iterable[str]] = ...,
         as_dict: bool = ...,
@@ -354,6 +867,10 @@ class RecordManagerBase(Generic[Record]):
         Use the ``as_dict`` parameter to return the record as
         a ``dict`` object, instead of a record object.
 
+        Within a prefetch scope (opened using ``prefetch_scope``
+        on the client), records that have already been fetched
+        with the default set of fields are returned from the cache.
+
         :param ids: Record ID
         :type ids: int
         :param fields: Fields to select, defaults to ``None`` (select all)
@@ -365,6 +882,16 @@ class RecordManagerBase(Generic[Record]):
         :return: List of records
         :rtype: Union[Record, List[str, Any]]
         """
+        # Within a prefetch scope, reuse record objects
+        # that have already been fetched.
+        if (
+            not fields
+            and not as_dict
+            and self._client._prefetch_scope is not None
+        ):
+            record = self._record_cache.get(id)
+            if record is not None:
+                return record
         try:
             return self.list(
                 id,
@@ -391,6 +918,9 @@ class RecordManagerBase(Generic[Record]):
         order: Optional[str] = ...,
         as_id: Literal[False] = ...,
         as_dict: Literal[False] = ...,
+        *,
+        prefetch: Optional[Iterable[str]] = ...,
+        limit: Optional[int] = ...,
     ) -> List[Record]: ...
 
     @overload
@@ -402,6 +932,8 @@ class RecordManagerBase(Generic[Record]):
         *,
         as_id: Literal[True],
         as_dict: Literal[False] = ...,
+        prefetch: Optional[Iterable[str]] = ...,
+        limit: Optional[int] = ...,
     ) -> List[int]: ...
 
     @overload
@@ -413,6 +945,8 @@ class RecordManagerBase(Generic[Record]):
         as_id: Literal[False] = ...,
         *,
         as_dict: Literal[True],
+        prefetch: Optional[Iterable[str]] = ...,
+        limit: Optional[int] = ...,
     ) -> List[Dict[str, Any]]: ...
 
     @overload
@@ -424,6 +958,8 @@ class RecordManagerBase(Generic[Record]):
         *,
         as_id: Literal[True],
         as_dict: Literal[True],
+        prefetch: Optional[Iterable[str]] = ...,
+        limit: Optional[int] = ...,
     ) -> List[int]: ...
 
     @overload
@@ -434,6 +970,9 @@ class RecordManagerBase(Generic[Record]):
         order: Optional[str] = ...,
         as_id: bool = ...,
         as_dict: bool = ...,
+        *,
+        prefetch: Optional[Iterable[str]] = ...,
+        limit: Optional[int] = ...,
     ) -> Union[List[Record], List[int], List[Dict[str, Any]]]: ...
 
     def search(
@@ -443,6 +982,9 @@ class RecordManagerBase(Generic[Record]):
         order: Optional[str] = None,
         as_id: bool = False,
         as_dict: bool = False,
+        *,
+        prefetch: Optional[Iterable[str]] = None,
+        limit: Optional[int] = None,
     ) -> Union[List[Record], List[int], List[Dict[str, Any]]]:
         """Query the ERP for records, optionally defining
         filters to constrain the search and other parameters,
@@ -508,6 +1050,14 @@ class RecordManagerBase(Generic[Record]):
 
         Use the ``as_dict`` parameter to return the record as
         a list of ``dict`` objects, instead of record objects.
+        Nested field references cannot be selected in ``fields``
+        when ``as_dict`` is ``True``.
+
+        Model refs on the returned record objects can be fetched in bulk
+        by passing them to ``prefetch``. For more information,
+        see the ``prefetch`` method.
+
+        Use the ``limit`` parameter to return at most that many records.
 
         :param filters: Filters to query by, defaults to ``None`` (no filters)
         :type filters: Union[Tuple[str, str, Any], Sequence[Any], str] | None
@@ -519,13 +1069,28 @@ class RecordManagerBase(Generic[Record]):
         :type as_id: bool, optional
         :param as_dict: Return records as dictionaries, defaults to ``False``
         :type as_dict: bool, optional
+        :param prefetch: Model refs to fetch in bulk, defaults to ``None``
+        :type prefetch: Optional[Iterable[str]], optional
+        :param limit: Maximum number of records to return, defaults to ``None``
+        :type limit: Optional[int], optional
+        :raises ValueError: If nested fields are selected with ``as_dict``
         :return: List of records
         :rtype: list[Record] or list[int] or list[dict[str, Any]]
         """
-        ids: List[int] = self._env.search(
-            (self._encode_filters(filters) if filters else []),
-            order=order,
-        )
+        domain = self._encode_filters(filters) if filters else []
+        # Record dictionaries are fetched in a single request,
+        # instead of searching for the IDs and then reading the records.
+        if as_dict and not as_id:
+            _fields, _ = self._encode_read_fields(fields, as_dict=True)
+            return self._decode_record_dicts(
+                self._env.search_read(
+                    domain,
+                    fields=_fields,
+                    order=order,
+                    limit=limit,
+                ),
+            )
+        ids: List[int] = self._env.search(domain, order=order, limit=limit)
         if as_id:
             return ids
         if ids:
@@ -533,6 +1098,7 @@ class RecordManagerBase(Generic[Record]):
                 ids,
                 fields=fields,
                 as_dict=as_dict,
+                prefetch=prefetch,
                 # A race condition might occur where a record is deleted
                 # after finding the ID but before querying the contents of it.
                 # If this happens, silently drop the record ID from the result.
@@ -540,6 +1106,165 @@ class RecordManagerBase(Generic[Record]):
             )
         return []  # type: ignore[return-value]
 
+    def clear_cache(self, *ids: int) -> None:
+        """Clear cached record objects for this manager.
+
+        Record objects fetched with the default set of fields
+        are cached by the manager, and reused when resolving
+        model refs on other record objects, instead of being
+        fetched from Odoo again.
+
+        If record IDs are specified, only those records are removed
+        from the cache. Otherwise, the entire cache is cleared.
+
+        :param ids: The record IDs to remove, defaults to all records
+        :type ids: int
+        """
+        with self._cache_lock:
+            if ids:
+                for record_id in ids:
+                    self._record_cache.pop(record_id, None)
+                    self._recent_records.pop(record_id, None)
+            else:
+                self._record_cache.clear()
+                self._recent_records.clear()
+
+    def _cache_record(self, record: Record) -> None:
+        # Add a record object to the cache, and mark it as
+        # the most recently used record object, discarding
+        # the least recently used record objects if the limit
+        # has been reached.
+        with self._cache_lock:
+            self._record_cache[record.id] = record
+            if self.record_cache_size <= 0:
+                return
+            self._recent_records[record.id] = record
+            self._recent_records.move_to_end(record.id)
+            while len(self._recent_records) > self.record_cache_size:
+                self._recent_records.popitem(last=False)
+
+    def _get_cached(self, id: int) -> Record:  # noqa: A002
+        # Get a record object with the default set of fields,
+        # using the cached record object if available.
+        # If another thread is already fetching the record,
+        # wait for it to be cached instead of fetching it again.
+        while True:
+            with self._cache_lock:
+                record = self._record_cache.get(id)
+                if record is not None:
+                    self._cache_record(record)
+                    return record
+                pending = self._pending_fetches.get(id)
+                if pending is None:
+                    pending = self._pending_fetches[id] = threading.Event()
+                    break
+            pending.wait()
+        try:
+            return self.get(id)
+        finally:
+            with self._cache_lock:
+                del self._pending_fetches[id]
+            pending.set()
+
+    def _get_subtree(
+        self,
+        record: Union[int, Record],
+        fields: Optional[Iterable[str]] = None,
+        order: Optional[str] = None,
+        *,
+        parent_field: str = "parent",
+        children_field: str = "children",
+    ) -> List[Record]:
+        # Fetch a record in a hierarchical model, and all of its
+        # descendants, using a single search query.
+        # The parent and children model refs of the returned records
+        # are populated using the other records in the subtree.
+        # The Odoo fields backing the model refs are always selected,
+        # so that the records can be linked together.
+        record_id = record.id if isinstance(record, RecordBase) else record
+        ref_fields = {
+            field: self._model_ref_fields[field]
+            for field in (children_field, parent_field)
+        }
+        if fields is not None:
+            fields = {
+                *fields,
+                *(
+                    ref_field.model_ref.field
+                    for ref_field in ref_fields.values()
+                ),
+            }
+        records = self.search(
+            [("id", "child_of", record_id)],
+            fields=fields,
+            order=order,
+        )
+        records_by_id: Dict[int, RecordBase] = {r.id: r for r in records}
+        # The parent of the root record is not part of the subtree,
+        # so it is fetched from Odoo if accessed.
+        for field, ref_field in ref_fields.items():
+            for r in records:
+                try:
+                    r.__dict__[field] = r._getattr_model_ref(
+                        ref_field=ref_field,
+                        ref_records=records_by_id,
+                    )
+                except KeyError:
+                    pass
+        return records
+
+    def _list_cached(
+        self,
+        ids: Iterable[int],
+        fields: Optional[Iterable[str]] = None,
+        optional: bool = False,
+    ) -> List[Record]:
+        # Get record objects, only fetching the records not already
+        # in the cache. Cached records have the default set of fields,
+        # which might not include all of the selected fields if the manager
+        # defines default fields, so cached records are only used
+        # if all of the selected fields were fetched.
+        ids = list(ids)
+        selected_fields: Optional[Set[str]] = None
+        if fields is not None:
+            fields = list(fields)
+            _fields, _ = self._encode_read_fields(fields)
+            selected_fields = set(_fields) if _fields else None
+        records: Dict[int, Record] = {}
+        missing_ids: List[int] = []
+        for record_id in ids:
+            record = self._record_cache.get(record_id)
+            if record is not None and (
+                record._fields is None
+                or selected_fields is None
+                or selected_fields.issubset(record._fields)
+            ):
+                self._cache_record(record)
+                records[record_id] = record
+            else:
+                missing_ids.append(record_id)
+        if missing_ids:
+            for record in self.list(
+                missing_ids,
+                fields=fields,
+                optional=optional,
+            ):
+                records[record.id] = record
+        results = [records[i] for i in ids if i in records]
+        # If some of the records were taken from the cache, make all
+        # of the returned records peers of each other, so that model refs
+        # on them (e.g. the partners of a project's contacts) are resolved
+        # together, instead of separately for the cached records.
+        # Within a prefetch scope, the records are already grouped
+        # with the other records fetched in the scope.
+        if (
+            fields is None
+            and len(missing_ids) < len(results) > 1
+            and self._client._prefetch_scope is None
+        ):
+            self.record_class._set_peers(results, self.prefetch_batch_size)
+        return results
+
     def _encode_filters(
         self,
         filters: Sequence[FilterCriterion],
@@ -593,9 +1318,9 @@ class RecordManagerBase(Generic[Record]):
             remote_field = self._encode_field(field_refs[0])
             if local_field not in self._record_type_hints:
                 return (Any, f"{remote_field}.{'.'.join(field_refs[1:])}")
-            type_hint: Any = self._record_type_hints[local_field]
-            model_ref = ModelRef.get(type_hint)
-            if model_ref:
+            ref_field = self._model_ref_fields.get(local_field)
+            if ref_field:
+                model_ref = ref_field.model_ref
                 record_class: Type[RecordBase] = (
                     self.record_class
                     if model_ref.record_class is Self
@@ -721,8 +1446,9 @@ class RecordManagerBase(Generic[Record]):
         # If this field is a model ref, encode the model ref
         # according to the given value's type, and map the result
         # to the Odoo model's ref field name.
-        model_ref = ModelRef.get(type_hint)
-        if model_ref:
+        ref_field = self._model_ref_fields.get(local_field)
+        if ref_field:
+            model_ref = ref_field.model_ref
             # NOTE(callumdickinson): JSON RPC API model link reference.
             # https://www.odoo.com/documentation/14.0/developer/reference/addons/orm.html#odoo.models.Model.write
             #  * (0, 0, {values}) - Link to a new record that needs to
@@ -831,6 +1557,10 @@ class RecordManagerBase(Generic[Record]):
                     ((i.id if isinstance(i, RecordBase) else i) for i in ids),
                 )
         self._env.unlink(_ids)
+        with self._cache_lock:
+            for record_id in _ids:
+                self._record_cache.pop(record_id, None)
+                self._recent_records.pop(record_id, None)
 
     def delete(
         self,
@@ -851,10 +1581,9 @@ class RecordManagerBase(Generic[Record]):
     def _get_remote_field(self, field: str) -> str:
         # If the field is a model ref, use the reference field name
         # as the remote field.
-        if field in self._record_type_hints:
-            model_ref = ModelRef.get(self._record_type_hints[field])
-            if model_ref:
-                field = model_ref.field
+        ref_field = self._model_ref_fields.get(field)
+        if ref_field:
+            field = ref_field.model_ref.field
         # Map the local field to the correct remote field name
         # based on the version of the Odoo server.
         return get_mapped_field(
@@ -878,6 +1607,12 @@ class RecordManagerBase(Generic[Record]):
         return local_field
 
     def _resolve_alias(self, field: str) -> str:
+        target_field = self._field_aliases.get(field)
+        if target_field is not None:
+            return target_field
+        return self._resolve_alias_chain(field)
+
+    def _resolve_alias_chain(self, field: str) -> str:
         if field not in self._record_type_hints:
             return field
         # NOTE(callumdickinson): Continually resolve field aliases
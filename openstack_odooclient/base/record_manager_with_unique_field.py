@@ -234,6 +234,8 @@ class RecordManagerWithUniqueFieldBase(
         """
         field_filter = [(field, "=", value)]
         try:
+            # Only two records are needed to know that
+            # the value is not unique.
             records = self.search(
                 filters=(
                     list(itertools.chain(field_filter, filters))
@@ -243,6 +245,7 @@ class RecordManagerWithUniqueFieldBase(
                 fields=fields,
                 as_id=as_id,
                 as_dict=as_dict,
+                limit=2,
             )
             if len(records) > 1:
                 raise MultipleRecordsFoundError(
@@ -264,3 +267,77 @@ class RecordManagerWithUniqueFieldBase(
                         f"with {field!r} value: {value}"
                     ),
                 ) from None
+
+    def _get_by_unique_field_multi(
+        self,
+        field: str,
+        values: Iterable[T],
+        filters: Optional[Iterable[Any]] = None,
+        fields: Optional[Iterable[str]] = None,
+        optional: bool = False,
+    ) -> Dict[T, Record]:
+        """Query multiple unique records by a specific field,
+        using a single search query.
+
+        Additional filters can be added to the search query using the
+        ``filters`` parameter, in the same way as ``_get_by_unique_field``.
+
+        When ``optional`` is ``True``, values for which a record
+        does not exist are omitted from the result, instead of
+        raising an error.
+
+        :param field: The unique field name to query by
+        :type field: str
+        :param values: The unique field values
+        :type values: Iterable[T]
+        :param filters: Optional additional filters to apply, defaults to None
+        :type filters: Optional[Iterable[Any]], optional
+        :param fields: Fields to select, defaults to ``None`` (select all)
+        :type fields: Iterable[str] or None, optional
+        :param optional: Omit values not found, defaults to False
+        :type optional: bool, optional
+        :raises MultipleRecordsFoundError: Multiple records with the same value
+        :raises RecordNotFoundError: Records with some values not found
+        :return: Records, indexed by unique field value
+        :rtype: Dict[T, Record]
+        """
+        values = list(dict.fromkeys(values))
+        if not values:
+            return {}
+        # The unique field is needed to index the results.
+        if fields is not None:
+            fields = list(fields)
+            if field not in fields:
+                fields.append(field)
+        field_filter = [(field, "in", values)]
+        records: Dict[T, Record] = {}
+        for record in self.search(
+            filters=(
+                list(itertools.chain(field_filter, filters))
+                if filters
+                else field_filter
+            ),
+            fields=fields,
+        ):
+            value = getattr(record, field)
+            if value in records:
+                raise MultipleRecordsFoundError(
+                    (
+                        f"Multiple {self.record_class.__name__} records "
+                        f"found with {field!r} value {value!r} "
+                        "when only one was expected: "
+                        f"{records[value]}, {record}"
+                    ),
+                )
+            records[value] = record
+        if not optional:
+            missing_values = [v for v in values if v not in records]
+            if missing_values:
+                raise RecordNotFoundError(
+                    (
+                        f"{self.record_class.__name__} records not found "
+                        f"with {field!r} values: "
+                        f"{', '.join(str(v) for v in missing_values)}"
+                    ),
+                )
+        return records
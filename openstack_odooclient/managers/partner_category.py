@@ -15,7 +15,7 @@
 
 from __future__ import annotations
 
-from typing import List, Literal, Optional, Union
+from typing import Iterable, List, Literal, Optional, Union
 
 from typing_extensions import Annotated, Self
 
@@ -82,6 +82,30 @@ class PartnerCategoryManager(NamedRecordManagerBase[PartnerCategory]):
     env_name = "res.partner.category"
     record_class = PartnerCategory
 
+    def get_subtree(
+        self,
+        category: Union[int, PartnerCategory],
+        fields: Optional[Iterable[str]] = None,
+        order: Optional[str] = None,
+    ) -> List[PartnerCategory]:
+        """Fetch a partner category, and all of its descendants,
+        using a single search query.
+
+        The ``parent`` and ``children`` fields of the returned categories
+        are populated using the other categories in the subtree,
+        so walking the subtree does not need to query Odoo again.
+
+        :param category: The root category of the subtree (ID or object)
+        :type category: int | PartnerCategory
+        :param fields: Fields to select, defaults to ``None`` (select all)
+        :type fields: Iterable[str] or None, optional
+        :param order: Order results by a specific field, defaults to None
+        :type order: Optional[str], optional
+        :return: List of partner categories in the subtree
+        :rtype: List[PartnerCategory]
+        """
+        return self._get_subtree(category, fields=fields, order=order)
+
 
 # NOTE(callumdickinson): Import here to make sure circular imports work.
 from .partner import Partner  # noqa: E402
@@ -15,13 +15,27 @@
 
 from __future__ import annotations
 
-from typing import Literal, Optional, Union
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from typing_extensions import Annotated
 
 from ..base.record import ModelRef, RecordBase
 from ..base.record_manager_named import NamedRecordManagerBase
 
+if TYPE_CHECKING:
+    from ..base.client import ClientBase
+
 
 class Pricelist(RecordBase["PricelistManager"]):
     active: bool
@@ -82,11 +96,55 @@ class Pricelist(RecordBase["PricelistManager"]):
             qty=qty,
         )
 
+    def get_prices(
+        self,
+        products: Iterable[Tuple[Union[int, Product], float]],
+        max_workers: int = 1,
+    ) -> List[float]:
+        """Get the prices to charge for a list of products and quantities.
+
+        Prices for duplicate product and quantity pairs
+        are only requested once.
+
+        :param products: Products (ID or object) and quantities to charge for
+        :type products: Iterable[Tuple[int | Product, float]]
+        :param max_workers: Concurrent requests to make, defaults to ``1``
+        :type max_workers: int, optional
+        :return: Prices to charge, in the same order as ``products``
+        :rtype: List[float]
+        """
+        return get_prices(
+            manager=self._manager,
+            pricelist=self,
+            products=products,
+            max_workers=max_workers,
+        )
+
 
 class PricelistManager(NamedRecordManagerBase[Pricelist]):
     env_name = "product.pricelist"
     record_class = Pricelist
 
+    price_cache_size: int = 0
+    """The number of most recently requested prices to cache,
+    indexed by pricelist, product and quantity.
+
+    Prices change when the pricelist rules are changed in Odoo,
+    so caching is disabled by default. When enabled, use
+    ``clear_price_cache`` to discard cached prices.
+    """
+
+    def __init__(self, client: ClientBase) -> None:
+        super().__init__(client)
+        self._price_cache: OrderedDict[Tuple[int, int, float], float] = (
+            OrderedDict()
+        )
+        """Cache of the most recently requested prices."""
+
+    def clear_price_cache(self) -> None:
+        """Discard all cached prices."""
+        self._price_cache.clear()
+
     def get_price(
         self,
         pricelist: Union[int, Pricelist],
@@ -112,6 +170,39 @@ class PricelistManager(NamedRecordManagerBase[Pricelist]):
             qty=qty,
         )
 
+    def get_prices(
+        self,
+        pricelist: Union[int, Pricelist],
+        products: Iterable[Tuple[Union[int, Product], float]],
+        max_workers: int = 1,
+    ) -> List[float]:
+        """Get the prices to charge for a given pricelist,
+        and a list of products and quantities.
+
+        Prices for duplicate product and quantity pairs
+        are only requested once.
+
+        Odoo does not provide a way to calculate the prices for multiple
+        products in a single request, so one request is made
+        per product and quantity. Set ``max_workers`` to a value
+        greater than 1 to make up to that many requests concurrently.
+
+        :param pricelist: Pricelist to reference (ID or object)
+        :type pricelist: int or Pricelist
+        :param products: Products (ID or object) and quantities to charge for
+        :type products: Iterable[Tuple[int | Product, float]]
+        :param max_workers: Concurrent requests to make, defaults to ``1``
+        :type max_workers: int, optional
+        :return: Prices to charge, in the same order as ``products``
+        :rtype: List[float]
+        """
+        return get_prices(
+            manager=self,
+            pricelist=pricelist,
+            products=products,
+            max_workers=max_workers,
+        )
+
 
 def get_price(
     manager: PricelistManager,
@@ -119,15 +210,71 @@ def get_price(
     product: Union[int, Product],
     qty: float,
 ) -> float:
+    return get_prices(
+        manager=manager,
+        pricelist=pricelist,
+        products=[(product, qty)],
+    )[0]
+
+
+def get_prices(
+    manager: PricelistManager,
+    pricelist: Union[int, Pricelist],
+    products: Iterable[Tuple[Union[int, Product], float]],
+    max_workers: int = 1,
+) -> List[float]:
     pricelist_id = (
         pricelist.id if isinstance(pricelist, Pricelist) else pricelist
     )
-    price = manager._env.price_get(
-        pricelist_id,
-        (product.id if isinstance(product, Product) else product),
-        max(qty, 0),
-    )[str(pricelist_id)]
-    return price if qty >= 0 else -price
+    pricelist_key = str(pricelist_id)
+    # Prices for negative quantities are calculated as the price
+    # for a quantity of zero, with the sign reversed.
+    items = [
+        (
+            (product.id if isinstance(product, Product) else product),
+            max(qty, 0),
+            qty < 0,
+        )
+        for product, qty in products
+    ]
+    # Only request the price for each product and quantity once.
+    # If price caching is enabled, only request prices
+    # that are not already cached.
+    requests = list(
+        dict.fromkeys((product_id, qty) for product_id, qty, _ in items),
+    )
+    cache_size = manager.price_cache_size
+    cache = manager._price_cache
+    prices: Dict[Tuple[int, float], float] = {}
+    if cache_size > 0:
+        for product_id, qty in requests:
+            cache_key = (pricelist_id, product_id, qty)
+            price = cache.get(cache_key)
+            if price is not None:
+                cache.move_to_end(cache_key)
+                prices[product_id, qty] = price
+        requests = [request for request in requests if request not in prices]
+
+    def _price_get(request: Tuple[int, float]) -> float:
+        return manager._env.price_get(pricelist_id, *request)[pricelist_key]
+
+    if max_workers > 1 and len(requests) > 1:
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(requests)),
+        ) as executor:
+            fetched = dict(zip(requests, executor.map(_price_get, requests)))
+    else:
+        fetched = {request: _price_get(request) for request in requests}
+    prices.update(fetched)
+    if cache_size > 0:
+        for (product_id, qty), price in fetched.items():
+            cache[pricelist_id, product_id, qty] = price
+        while len(cache) > cache_size:
+            cache.popitem(last=False)
+    return [
+        -prices[product_id, qty] if negative else prices[product_id, qty]
+        for product_id, qty, negative in items
+    ]
 
 
 # NOTE(callumdickinson): Import here to make sure circular imports work.
@@ -15,13 +15,16 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from typing import (
+    TYPE_CHECKING,
     Any,
     Dict,
     Iterable,
     List,
     Literal,
     Optional,
+    Tuple,
     Union,
     overload,
 )
@@ -33,6 +36,9 @@ from ..base.record_manager_with_unique_field import (
     RecordManagerWithUniqueFieldBase,
 )
 
+if TYPE_CHECKING:
+    from ..base.client import ClientBase
+
 
 class Product(RecordBase["ProductManager"]):
     categ_id: Annotated[int, ModelRef("categ_id", ProductCategory)]
@@ -101,6 +107,64 @@ class ProductManager(RecordManagerWithUniqueFieldBase[Product, str]):
     env_name = "product.product"
     record_class = Product
 
+    sellable_fields: Tuple[str, ...] = (
+        "id",
+        "create_date",
+        "create_uid",
+        "write_date",
+        "write_uid",
+        "categ_id",
+        "company_id",
+        "default_code",
+        "description",
+        "display_name",
+        "list_price",
+        "name",
+        "uom_id",
+    )
+    """The fields selected by default when querying sellable products
+    (using ``get_sellable_company_products``,
+    ``get_sellable_company_product_by_name`` and
+    ``get_sellable_company_products_by_names``), set to the fields
+    defined on the product record class.
+
+    Products have a number of large fields (e.g. product images)
+    which are not used by this library, and would otherwise be fetched
+    with every product in these bulk lookups. To fetch other fields,
+    select them using the ``fields`` parameter.
+    Records returned as dictionaries select all fields by default.
+    """
+
+    name_cache_size: int = 0
+    """The number of most recent product lookups by name to cache,
+    indexed by company, name and query parameters.
+
+    Products can be changed or renamed in Odoo at any time,
+    so caching is disabled by default. When enabled, use
+    ``clear_name_cache`` to discard cached lookups.
+    """
+
+    def __init__(self, client: ClientBase) -> None:
+        super().__init__(client)
+        self._name_cache: OrderedDict[Tuple[Any, ...], Any] = OrderedDict()
+        """Cache of the most recent product lookups by name."""
+
+    def clear_name_cache(self) -> None:
+        """Discard all cached product lookups by name."""
+        self._name_cache.clear()
+
+    def _get_sellable_fields(
+        self,
+        fields: Optional[Iterable[str]],
+        as_dict: bool = False,
+    ) -> Optional[Iterable[str]]:
+        # Select only the fields defined on the product record class
+        # in the sellable product lookups, unless fields were selected
+        # or the records are being returned as dictionaries.
+        if fields is None and not as_dict:
+            return self.sellable_fields
+        return fields
+
     @overload
     def get_sellable_company_products(
         self,
@@ -110,6 +174,7 @@ class ProductManager(RecordManagerWithUniqueFieldBase[Product, str]):
         order: Optional[str] = ...,
         as_id: Literal[False] = ...,
         as_dict: Literal[False] = ...,
+        prefetch: Optional[Iterable[str]] = ...,
     ) -> List[Product]: ...
 
     @overload
@@ -121,6 +186,7 @@ class ProductManager(RecordManagerWithUniqueFieldBase[Product, str]):
         order: Optional[str] = ...,
         as_id: Literal[True],
         as_dict: Literal[False] = ...,
+        prefetch: Optional[Iterable[str]] = ...,
     ) -> List[int]: ...
 
     @overload
@@ -132,6 +198,7 @@ class ProductManager(RecordManagerWithUniqueFieldBase[Product, str]):
         *,
         as_id: Literal[True],
         as_dict: Literal[True],
+        prefetch: Optional[Iterable[str]] = ...,
     ) -> List[int]: ...
 
     @overload
@@ -143,6 +210,7 @@ class ProductManager(RecordManagerWithUniqueFieldBase[Product, str]):
         order: Optional[str] = ...,
         as_id: Literal[False] = ...,
         as_dict: Literal[True],
+        prefetch: Optional[Iterable[str]] = ...,
     ) -> List[Dict[str, Any]]: ...
 
     @overload
@@ -154,6 +222,7 @@ class ProductManager(RecordManagerWithUniqueFieldBase[Product, str]):
         order: Optional[str] = ...,
         as_id: bool = ...,
         as_dict: bool = ...,
+        prefetch: Optional[Iterable[str]] = ...,
     ) -> Union[List[Product], List[int], Union[List[Dict[str, Any]]]]: ...
 
     def get_sellable_company_products(
@@ -163,12 +232,14 @@ class ProductManager(RecordManagerWithUniqueFieldBase[Product, str]):
         order: Optional[str] = None,
         as_id: bool = False,
         as_dict: bool = False,
+        *,
+        prefetch: Optional[Iterable[str]] = None,
     ) -> Union[List[Product], List[int], Union[List[Dict[str, Any]]]]:
         """Fetch a list of active and saleable products for the given company.
 
         :param company: The company to search for products (ID or object)
         :type company: int | Company
-        :param fields: Fields to select, defaults to ``None`` (select all)
+        :param fields: Fields to select, defaults to ``None`` (select defaults)
         :type fields: Iterable[str] or None, optional
         :param order: Order results by a specific field, defaults to None
         :type order: Optional[str], optional
@@ -176,19 +247,23 @@ class ProductManager(RecordManagerWithUniqueFieldBase[Product, str]):
         :type as_id: bool, optional
         :param as_dict: Return records as dictionaries, defaults to False
         :type as_dict: bool, optional
+        :param prefetch: Model refs to fetch in bulk, defaults to ``None``
+        :type prefetch: Optional[Iterable[str]], optional
         :return: List of products
         :rtype: Union[List[Product], List[int], Union[Dict[str, Any]]]
         """
+        company_id = company.id if isinstance(company, Company) else company
         return self.search(
             [
-                ("company_id", "=", company),
+                ("company_id", "=", company_id),
                 ("active", "=", True),
                 ("sale_ok", "=", True),
             ],
-            fields=fields,
+            fields=self._get_sellable_fields(fields, as_dict),
             order=order,
             as_id=as_id,
             as_dict=as_dict,
+            prefetch=prefetch,
         )
 
     @overload
@@ -313,8 +388,8 @@ class ProductManager(RecordManagerWithUniqueFieldBase[Product, str]):
         A number of parameters are available to configure the return type,
         and what happens when a result is not found.
 
-        By default all fields available on the record model
-        will be selected, but this can be filtered using the
+        By default the fields defined on the record class
+        will be selected, but this can be changed using the
         ``fields`` parameter.
 
         Use the ``as_id`` parameter to return the ID of the record,
@@ -330,7 +405,7 @@ class ProductManager(RecordManagerWithUniqueFieldBase[Product, str]):
         :type company: int | Company
         :param name: The product name
         :type name: str
-        :param fields: Fields to select, defaults to ``None`` (select all)
+        :param fields: Fields to select, defaults to ``None`` (select defaults)
         :type fields: Iterable[str] or None, optional
         :param as_id: Return a record ID, defaults to False
         :type as_id: bool, optional
@@ -343,19 +418,86 @@ class ProductManager(RecordManagerWithUniqueFieldBase[Product, str]):
         :return: Product (or ``None`` if record not found and optional)
         :rtype: Optional[Union[Record, int, Dict[str, Any]]]
         """
-        return self._get_by_unique_field(
+        if fields is not None:
+            fields = tuple(fields)
+        company_id = company.id if isinstance(company, Company) else company
+        cache_key = (
+            company_id,
+            name,
+            fields,
+            as_id,
+            as_dict,
+        )
+        cache = self._name_cache
+        if self.name_cache_size > 0 and cache_key in cache:
+            cache.move_to_end(cache_key)
+            result = cache[cache_key]
+            return dict(result) if isinstance(result, dict) else result
+        result = self._get_by_unique_field(
             field="name",
             value=name,
             filters=[
-                ("company_id", "=", company),
+                ("company_id", "=", company_id),
                 ("active", "=", True),
                 ("sale_ok", "=", True),
             ],
-            fields=fields,
+            fields=self._get_sellable_fields(fields, as_dict),
             as_id=as_id,
             as_dict=as_dict,
             optional=optional,
         )
+        # Products that were not found are not cached,
+        # as they may be created later.
+        if self.name_cache_size > 0 and result is not None:
+            cache[cache_key] = (
+                dict(result) if isinstance(result, dict) else result
+            )
+            while len(cache) > self.name_cache_size:
+                cache.popitem(last=False)
+        return result
+
+    def get_sellable_company_products_by_names(
+        self,
+        company: Union[int, Company],
+        names: Iterable[str],
+        fields: Optional[Iterable[str]] = None,
+        optional: bool = False,
+    ) -> Dict[str, Product]:
+        """Query multiple active and saleable products for the given company
+        by name, using a single search query.
+
+        This is more efficient than calling
+        ``get_sellable_company_product_by_name`` for each name.
+
+        When ``optional`` is ``True``, names for which a product
+        does not exist are omitted from the result, instead of
+        raising an error.
+
+        :param company: The company to search for products (ID or object)
+        :type company: int | Company
+        :param names: The product names
+        :type names: Iterable[str]
+        :param fields: Fields to select, defaults to ``None`` (select defaults)
+        :type fields: Iterable[str] or None, optional
+        :param optional: Omit names not found, defaults to False
+        :type optional: bool, optional
+        :raises MultipleRecordsFoundError: Multiple records with the same name
+        :raises RecordNotFoundError: Records with some names not found
+        :return: Products, indexed by name
+        :rtype: Dict[str, Product]
+        """
+        company_id = company.id if isinstance(company, Company) else company
+        return self._get_by_unique_field_multi(
+            field="name",
+            values=names,
+            filters=[
+                ("company_id", "=", company_id),
+                ("active", "=", True),
+                ("sale_ok", "=", True),
+            ],
+            fields=self._get_sellable_fields(fields),
+            optional=optional,
+        )
 
 
 # NOTE(callumdickinson): Import here to make sure circular imports work.
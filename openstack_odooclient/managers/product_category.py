@@ -15,7 +15,7 @@
 
 from __future__ import annotations
 
-from typing import List, Literal, Optional, Union
+from typing import Dict, Iterable, List, Literal, Optional, Union
 
 from typing_extensions import Annotated, Self
 
@@ -67,7 +67,98 @@ class ProductCategory(RecordBase["ProductCategoryManager"]):
     product_count: int
     """The number of products under this category."""
 
+    def get_ancestors(self) -> List[Self]:
+        """Fetch the ancestors of this product category,
+        starting from the root category.
+
+        The ancestors are found using the parent path of this category,
+        and fetched in a single query (or taken from the record cache).
+
+        :return: List of ancestor product categories
+        :rtype: List[ProductCategory]
+        """
+        # The parent path lists the IDs of the ancestors,
+        # followed by the ID of this category.
+        if self.parent_path:
+            ancestor_ids = [
+                int(category_id)
+                for category_id in self.parent_path.strip("/").split("/")
+                if category_id and int(category_id) != self.id
+            ]
+            return self._manager._list_cached(  # type: ignore[return-value]
+                ancestor_ids,
+            )
+        # The parent path is not available, so search for the ancestors
+        # and order them by walking up the tree from this category.
+        ancestors: Dict[int, ProductCategory] = {
+            category.id: category
+            for category in self._manager.search(
+                [("id", "parent_of", self.id), ("id", "!=", self.id)],
+            )
+        }
+        ancestor_list: List[Self] = []
+        parent_id = self.parent_id
+        while parent_id and parent_id in ancestors:
+            ancestor = ancestors.pop(parent_id)
+            ancestor_list.append(ancestor)  # type: ignore[arg-type]
+            parent_id = ancestor.parent_id
+        ancestor_list.reverse()
+        return ancestor_list
+
+    def get_descendants(
+        self,
+        fields: Optional[Iterable[str]] = None,
+        order: Optional[str] = None,
+    ) -> List[Self]:
+        """Fetch all descendants of this product category,
+        using a single search query.
+
+        The ``parent`` and ``children`` fields of the returned categories
+        are populated using the other fetched categories.
+        For more information, see ``get_subtree`` on the manager.
+
+        :param fields: Fields to select, defaults to ``None`` (select all)
+        :type fields: Iterable[str] or None, optional
+        :param order: Order results by a specific field, defaults to None
+        :type order: Optional[str], optional
+        :return: List of descendant product categories
+        :rtype: List[ProductCategory]
+        """
+        return [
+            category  # type: ignore[misc]
+            for category in self._manager.get_subtree(
+                self,
+                fields=fields,
+                order=order,
+            )
+            if category.id != self.id
+        ]
+
 
 class ProductCategoryManager(NamedRecordManagerBase[ProductCategory]):
     env_name = "product.category"
     record_class = ProductCategory
+
+    def get_subtree(
+        self,
+        category: Union[int, ProductCategory],
+        fields: Optional[Iterable[str]] = None,
+        order: Optional[str] = None,
+    ) -> List[ProductCategory]:
+        """Fetch a product category, and all of its descendants,
+        using a single search query.
+
+        The ``parent`` and ``children`` fields of the returned categories
+        are populated using the other categories in the subtree,
+        so walking the subtree does not need to query Odoo again.
+
+        :param category: The root category of the subtree (ID or object)
+        :type category: int | ProductCategory
+        :param fields: Fields to select, defaults to ``None`` (select all)
+        :type fields: Iterable[str] or None, optional
+        :param order: Order results by a specific field, defaults to None
+        :type order: Optional[str], optional
+        :return: List of product categories in the subtree
+        :rtype: List[ProductCategory]
+        """
+        return self._get_subtree(category, fields=fields, order=order)
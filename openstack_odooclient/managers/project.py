@@ -15,7 +15,9 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from typing import (
+    TYPE_CHECKING,
     Any,
     Dict,
     Iterable,
@@ -33,6 +35,9 @@ from ..base.record_manager_with_unique_field import (
     RecordManagerWithUniqueFieldBase,
 )
 
+if TYPE_CHECKING:
+    from ..base.client import ClientBase
+
 
 class Project(RecordBase["ProjectManager"]):
     billing_type: Literal["customer", "internal"]
@@ -205,6 +210,30 @@ class ProjectManager(RecordManagerWithUniqueFieldBase[Project, str]):
     env_name = "openstack.project"
     record_class = Project
 
+    os_id_cache_size: int = 0
+    """The number of most recent project lookups by OpenStack project ID
+    to cache.
+
+    Only the record ID of each project is cached. Unless only the ID
+    is requested, the project is still read from Odoo using its ID,
+    instead of being searched for.
+
+    Projects deleted by other clients are not detected when only the ID
+    is requested, so caching is disabled by default. When enabled, use
+    ``clear_os_id_cache`` to discard cached lookups.
+    """
+
+    def __init__(self, client: ClientBase) -> None:
+        super().__init__(client)
+        self._os_id_cache: OrderedDict[str, int] = OrderedDict()
+        """Cache of record IDs for the most recent project lookups
+        by OpenStack project ID.
+        """
+
+    def clear_os_id_cache(self) -> None:
+        """Discard all cached project lookups by OpenStack project ID."""
+        self._os_id_cache.clear()
+
     @overload
     def get_by_os_id(
         self,
@@ -345,7 +374,23 @@ class ProjectManager(RecordManagerWithUniqueFieldBase[Project, str]):
         :return: Query result (or ``None`` if record not found and optional)
         :rtype: Optional[Union[Project, int, Dict[str, Any]]]
         """
-        return self._get_by_unique_field(
+        cache = self._os_id_cache
+        if self.os_id_cache_size > 0 and os_id in cache:
+            cache.move_to_end(os_id)
+            record_id = cache[os_id]
+            if as_id:
+                return record_id
+            record = self.get(
+                record_id,
+                fields=fields,
+                as_dict=as_dict,
+                optional=True,
+            )
+            if record is not None:
+                return record
+            # The project has since been deleted.
+            cache.pop(os_id, None)
+        result = self._get_by_unique_field(
             field="os_id",
             value=os_id,
             fields=fields,
@@ -353,6 +398,79 @@ class ProjectManager(RecordManagerWithUniqueFieldBase[Project, str]):
             as_dict=as_dict,
             optional=optional,
         )
+        # Projects that were not found are not cached,
+        # as they may be created later.
+        if self.os_id_cache_size > 0 and result is not None:
+            if isinstance(result, int):
+                cache[os_id] = result
+            elif isinstance(result, dict):
+                cache[os_id] = result["id"]
+            else:
+                cache[os_id] = result.id
+            while len(cache) > self.os_id_cache_size:
+                cache.popitem(last=False)
+        return result
+
+    def get_by_os_ids(
+        self,
+        os_ids: Iterable[str],
+        fields: Optional[Iterable[str]] = None,
+        optional: bool = False,
+    ) -> Dict[str, Project]:
+        """Query multiple projects by OpenStack project ID,
+        using a single search query.
+
+        This is more efficient than calling ``get_by_os_id``
+        for each project ID.
+
+        When ``optional`` is ``True``, project IDs for which a record
+        does not exist are omitted from the result, instead of
+        raising an error.
+
+        :param os_ids: The OpenStack project IDs to search for
+        :type os_ids: Iterable[str]
+        :param fields: Fields to select, defaults to ``None`` (select all)
+        :type fields: Iterable[str] or None, optional
+        :param optional: Omit project IDs not found, defaults to False
+        :type optional: bool, optional
+        :raises MultipleRecordsFoundError: Multiple with matching project IDs
+        :raises RecordNotFoundError: Records with some project IDs not found
+        :return: Projects, indexed by OpenStack project ID
+        :rtype: Dict[str, Project]
+        """
+        projects = self._get_by_unique_field_multi(
+            field="os_id",
+            values=os_ids,
+            fields=fields,
+            optional=optional,
+        )
+        if self.os_id_cache_size > 0:
+            cache = self._os_id_cache
+            for os_id, project in projects.items():
+                cache[os_id] = project.id
+                cache.move_to_end(os_id)
+            while len(cache) > self.os_id_cache_size:
+                cache.popitem(last=False)
+        return projects
+
+    def unlink(
+        self,
+        *records: Union[int, Project, Iterable[Union[int, Project]]],
+    ) -> None:
+        """Delete one or more records from Odoo.
+
+        This method accepts either a record object or ID, or an iterable of
+        either of those types. Multiple positional arguments are allowed.
+
+        All specified records will be deleted in a single request,
+        and any cached project lookups by OpenStack project ID
+        are discarded.
+
+        :param records: The records to delete (object, ID, or record/ID list)
+        :type records: Union[Record, int, Iterable[Union[Record, int]]]
+        """
+        super().unlink(*records)
+        self.clear_os_id_cache()
 
 
 # NOTE(callumdickinson): Import here to make sure circular imports work.
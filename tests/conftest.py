@@ -0,0 +1,149 @@
+# Copyright (C) 2024 Catalyst Cloud Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import pytest
+
+from openstack_odooclient import Client
+
+
+class FakeModel:
+    """An in-memory stand-in for an OdooRPC model,
+    supporting the subset of the API used by the record managers.
+
+    Every call made to the model is recorded in ``calls``.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.records: Dict[int, Dict[str, Any]] = {}
+        self.calls: List[str] = []
+        self.prices: Dict[int, float] = {}
+        """Unit prices for products, used by ``price_get``."""
+        self.price_requests: List[Tuple[int, int, float]] = []
+
+    def _match(self, record: Dict[str, Any], domain: List[Any]) -> bool:
+        for criterion in domain:
+            if isinstance(criterion, str):
+                continue
+            field, operator, value = criterion
+            record_value = record.get(field)
+            if isinstance(record_value, list) and len(record_value) == 2:  # noqa: PLR2004
+                record_value = record_value[0]
+            if operator == "=" and record_value != value:
+                return False
+            if operator == "in" and record_value not in value:
+                return False
+            if operator == "child_of" and not self._is_child_of(
+                record_value,
+                value,
+            ):
+                return False
+        return True
+
+    def _is_child_of(self, record_id: Optional[int], parent_id: int) -> bool:
+        while record_id:
+            if record_id == parent_id:
+                return True
+            parent = self.records.get(record_id, {}).get("parent_id")
+            record_id = parent[0] if parent else None
+        return False
+
+    def _select(
+        self,
+        record: Dict[str, Any],
+        fields: Optional[List[str]],
+    ) -> Dict[str, Any]:
+        if not fields:
+            return dict(record)
+        return {k: v for k, v in record.items() if k == "id" or k in fields}
+
+    def read(
+        self,
+        ids: Union[int, List[int]],
+        fields: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        self.calls.append("read")
+        _ids = [ids] if isinstance(ids, int) else ids
+        return [
+            self._select(self.records[i], fields)
+            for i in _ids
+            if i in self.records
+        ]
+
+    def search(
+        self,
+        domain: List[Any],
+        order: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[int]:
+        self.calls.append("search")
+        ids = [i for i, r in self.records.items() if self._match(r, domain)]
+        return ids[:limit] if limit else ids
+
+    def search_read(
+        self,
+        domain: List[Any],
+        fields: Optional[List[str]] = None,
+        order: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        self.calls.append("search_read")
+        return [
+            self._select(self.records[i], fields)
+            for i in self.search(domain, limit=limit)
+        ]
+
+    def price_get(
+        self,
+        pricelist_id: int,
+        product_id: int,
+        qty: float,
+    ) -> Dict[str, float]:
+        self.calls.append("price_get")
+        self.price_requests.append((pricelist_id, product_id, qty))
+        return {str(pricelist_id): self.prices[product_id] * qty}
+
+    def unlink(self, ids: List[int]) -> None:
+        self.calls.append("unlink")
+        for i in ids:
+            self.records.pop(i, None)
+
+
+class FakeEnvironment(Dict[str, FakeModel]):
+    def __missing__(self, name: str) -> FakeModel:
+        model = self[name] = FakeModel(name)
+        return model
+
+
+class FakeODOO:
+    """An in-memory stand-in for an ``odoorpc.ODOO`` connection."""
+
+    def __init__(self) -> None:
+        self.version = "14.0"
+        self.env = FakeEnvironment()
+
+
+@pytest.fixture
+def odoo() -> FakeODOO:
+    return FakeODOO()
+
+
+@pytest.fixture
+def client(odoo: FakeODOO) -> Client:
+    return Client(odoo=odoo)  # type: ignore[arg-type]
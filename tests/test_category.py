@@ -0,0 +1,61 @@
+# Copyright (C) 2024 Catalyst Cloud Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from openstack_odooclient import Client, RecordManagerBase
+
+    from .conftest import FakeODOO
+
+TREE = {
+    1: (False, [2, 3]),
+    2: ([1, "root"], [4]),
+    3: ([1, "root"], []),
+    4: ([2, "a"], []),
+}
+
+
+@pytest.fixture(params=["partner_categories", "product_categories"])
+def manager(
+    request: pytest.FixtureRequest,
+    client: Client,
+    odoo: FakeODOO,
+) -> RecordManagerBase:
+    manager = getattr(client, request.param)
+    model = odoo.env[manager.env_name]
+    for record_id, (parent_id, child_ids) in TREE.items():
+        model.records[record_id] = {
+            "id": record_id,
+            "name": str(record_id),
+            "parent_id": parent_id,
+            "child_id": child_ids,
+        }
+    return manager
+
+
+def test_get_subtree(manager: RecordManagerBase, odoo: FakeODOO) -> None:
+    categories = manager.get_subtree(2, fields=["name"])
+    assert sorted(c.id for c in categories) == [2, 4]
+    model = odoo.env[manager.env_name]
+    model.calls.clear()
+    root = next(c for c in categories if c.id == 2)  # noqa: PLR2004
+    assert [c.id for c in root.children] == [4]
+    assert root.children[0].parent is root
+    assert model.calls == []
@@ -0,0 +1,212 @@
+# Copyright (C) 2024 Catalyst Cloud Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import http.client
+import socket
+import urllib.error
+import urllib.request
+
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+import pytest
+
+from openstack_odooclient.base.connection import ConnectionPool
+
+URL = "http://odoo.example.com:8069/jsonrpc"
+HTTPS_URL = "https://odoo.example.com:8069/jsonrpc"
+
+
+class FakeResponse:
+    def __init__(self, will_close: bool = False) -> None:
+        self.will_close = will_close
+        self.msg = http.client.HTTPMessage()
+        self.status = 200
+        self.reason = "OK"
+
+    def read(self) -> bytes:
+        return b"{}"
+
+
+class FakeConnection:
+    """A stand-in for ``http.client.HTTPConnection``,
+    backed by a connected socket pair so that the pool
+    can check whether the connection was dropped.
+    """
+
+    instances: List[FakeConnection]
+    errors: List[Exception]
+
+    def __init__(self, host: str, timeout: Any = None) -> None:
+        self.host = host
+        self.timeout = timeout
+        self.sock: Optional[socket.socket]
+        self.sock, self.peer = socket.socketpair()
+        self.tunnel: Optional[Tuple[str, Dict[str, str]]] = None
+        self.requests: List[Tuple[str, str, Dict[str, str]]] = []
+        self.closed = False
+        self.instances.append(self)
+
+    def set_tunnel(self, host: str, headers: Dict[str, str]) -> None:
+        self.tunnel = (host, headers)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        headers: Dict[str, str],
+    ) -> None:
+        if self.errors:
+            raise self.errors.pop(0)
+        self.requests.append((method, url, headers))
+
+    def getresponse(self) -> FakeResponse:
+        return FakeResponse()
+
+    def close(self) -> None:
+        self.closed = True
+        if self.sock is not None:
+            self.sock.close()
+            self.peer.close()
+            self.sock = None
+
+
+@pytest.fixture
+def connection_class() -> Type[FakeConnection]:
+    class Connection(FakeConnection):
+        instances: List[FakeConnection] = []
+        errors: List[Exception] = []
+
+    return Connection
+
+
+@pytest.fixture
+def pool(connection_class: Type[FakeConnection]) -> ConnectionPool:
+    return ConnectionPool(connection_class)  # type: ignore[arg-type]
+
+
+def make_request(
+    url: str = URL,
+    timeout: float = 10,
+    headers: Optional[Dict[str, str]] = None,
+) -> urllib.request.Request:
+    req = urllib.request.Request(url, data=b"{}", headers=headers or {})  # noqa: S310
+    req.timeout = timeout  # type: ignore[attr-defined]
+    return req
+
+
+def test_reuse(
+    pool: ConnectionPool,
+    connection_class: Type[FakeConnection],
+) -> None:
+    assert pool.urlopen(make_request()).read() == b"{}"
+    assert pool.urlopen(make_request()).read() == b"{}"
+    (connection,) = connection_class.instances
+    assert len(connection.requests) == 2  # noqa: PLR2004
+    assert connection.requests[0][2]["Connection"] == "keep-alive"
+
+
+def test_reuse_timeout(
+    pool: ConnectionPool,
+    connection_class: Type[FakeConnection],
+) -> None:
+    pool.urlopen(make_request(timeout=10))
+    pool.urlopen(make_request(timeout=5))
+    (connection,) = connection_class.instances
+    assert connection.timeout == 5  # noqa: PLR2004
+    assert connection.sock is not None
+    assert connection.sock.gettimeout() == 5  # noqa: PLR2004
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        BrokenPipeError(),
+        ConnectionResetError(),
+        http.client.RemoteDisconnected("Remote end closed connection"),
+    ],
+)
+def test_retry_stale_connection(
+    pool: ConnectionPool,
+    connection_class: Type[FakeConnection],
+    error: Exception,
+) -> None:
+    pool.urlopen(make_request())
+    connection_class.errors.append(error)
+    assert pool.urlopen(make_request()).read() == b"{}"
+    stale, fresh = connection_class.instances
+    assert stale.closed
+    assert len(fresh.requests) == 1
+
+
+def test_no_retry_new_connection(
+    pool: ConnectionPool,
+    connection_class: Type[FakeConnection],
+) -> None:
+    pool.urlopen(make_request())
+    connection_class.errors.extend([BrokenPipeError(), BrokenPipeError()])
+    # The request is only retried once, on a new connection.
+    # Errors from the new connection are raised.
+    with pytest.raises(urllib.error.URLError):
+        pool.urlopen(make_request())
+    assert len(connection_class.instances) == 2  # noqa: PLR2004
+
+
+def test_dropped_connection(
+    pool: ConnectionPool,
+    connection_class: Type[FakeConnection],
+) -> None:
+    pool.urlopen(make_request())
+    dropped = connection_class.instances[0]
+    # The server closing the connection makes the socket readable.
+    dropped.peer.close()
+    pool.urlopen(make_request())
+    assert dropped.closed
+    assert len(dropped.requests) == 1
+    assert len(connection_class.instances) == 2  # noqa: PLR2004
+
+
+def test_tunnel(
+    pool: ConnectionPool,
+    connection_class: Type[FakeConnection],
+) -> None:
+    req = make_request(
+        url=HTTPS_URL,
+        headers={"Proxy-Authorization": "Basic dGVzdA=="},
+    )
+    req.set_proxy("proxy.example.com:3128", "http")
+    pool.urlopen(req)
+    pool.urlopen(make_request())
+    tunnelled, direct = connection_class.instances
+    assert tunnelled.host == "proxy.example.com:3128"
+    assert tunnelled.tunnel == (
+        "odoo.example.com:8069",
+        {"Proxy-Authorization": "Basic dGVzdA=="},
+    )
+    assert "Proxy-Authorization" not in tunnelled.requests[0][2]
+    assert direct.host == "odoo.example.com:8069"
+    assert direct.tunnel is None
+
+
+def test_close(
+    pool: ConnectionPool,
+    connection_class: Type[FakeConnection],
+) -> None:
+    pool.urlopen(make_request())
+    pool.close()
+    (connection,) = connection_class.instances
+    assert connection.closed
@@ -0,0 +1,166 @@
+# Copyright (C) 2024 Catalyst Cloud Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, List, Set
+
+import pytest
+
+from openstack_odooclient.managers import pricelist as pricelist_module
+
+if TYPE_CHECKING:
+    from openstack_odooclient import Client
+
+    from .conftest import FakeModel, FakeODOO
+
+
+@pytest.fixture
+def pricelists(odoo: FakeODOO) -> FakeModel:
+    model = odoo.env["product.pricelist"]
+    model.records[1] = {"id": 1, "name": "pricelist"}
+    model.prices.update({10: 1.0, 20: 2.0, 30: 3.0})
+    return model
+
+
+def test_get_prices(client: Client, pricelists: FakeModel) -> None:
+    prices = client.pricelists.get_prices(1, [(10, 2), (20, 3)])
+    assert prices == [2.0, 6.0]
+    assert pricelists.price_requests == [(1, 10, 2), (1, 20, 3)]
+
+
+def test_get_prices_duplicates(client: Client, pricelists: FakeModel) -> None:
+    prices = client.pricelists.get_prices(
+        1,
+        [(10, 2), (20, 3), (10, 2), (10, 4), (20, 3)],
+    )
+    assert prices == [2.0, 6.0, 2.0, 4.0, 6.0]
+    assert pricelists.price_requests == [(1, 10, 2), (1, 20, 3), (1, 10, 4)]
+
+
+def test_get_prices_negative_qty(
+    client: Client,
+    pricelists: FakeModel,
+) -> None:
+    # Negative quantities are priced as a quantity of zero,
+    # with the sign reversed.
+    assert client.pricelists.get_prices(1, [(10, -2)]) == [-0.0]
+    assert pricelists.price_requests == [(1, 10, 0)]
+
+
+def test_get_prices_max_workers(
+    client: Client,
+    pricelists: FakeModel,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    executors: List[int] = []
+    threads: Set[int] = set()
+    price_get = pricelists.price_get
+
+    class Executor(ThreadPoolExecutor):
+        def __init__(self, max_workers: int, **kwargs: Any) -> None:
+            executors.append(max_workers)
+            super().__init__(max_workers=max_workers, **kwargs)
+
+    def _price_get(*args: Any) -> Any:
+        threads.add(threading.get_ident())
+        return price_get(*args)
+
+    monkeypatch.setattr(pricelist_module, "ThreadPoolExecutor", Executor)
+    monkeypatch.setattr(pricelists, "price_get", _price_get)
+    prices = client.pricelists.get_prices(
+        1,
+        [(30, 1), (10, 2), (20, 3), (10, 2), (30, 1)],
+        max_workers=8,
+    )
+    assert prices == [3.0, 2.0, 6.0, 2.0, 3.0]
+    # Only as many workers as there are unique requests are started.
+    assert executors == [3]
+    assert threading.get_ident() not in threads
+    assert sorted(pricelists.price_requests) == [
+        (1, 10, 2),
+        (1, 20, 3),
+        (1, 30, 1),
+    ]
+
+
+def test_get_prices_max_workers_single_request(
+    client: Client,
+    pricelists: FakeModel,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(pricelist_module, "ThreadPoolExecutor", None)
+    prices = client.pricelists.get_prices(1, [(10, 2), (10, 2)], max_workers=8)
+    assert prices == [2.0, 2.0]
+    assert pricelists.price_requests == [(1, 10, 2)]
+
+
+def test_get_price(client: Client, pricelists: FakeModel) -> None:
+    assert client.pricelists.get_price(1, 20, 3) == 6.0  # noqa: PLR2004
+    assert pricelists.price_requests == [(1, 20, 3)]
+
+
+def test_get_price_record(client: Client, pricelists: FakeModel) -> None:
+    pricelist = client.pricelists.get(1)
+    assert pricelist.get_price(20, 3) == 6.0  # noqa: PLR2004
+    assert pricelist.get_prices([(20, 3), (10, 1)]) == [6.0, 1.0]
+    assert pricelists.price_requests == [(1, 20, 3), (1, 20, 3), (1, 10, 1)]
+
+
+def test_price_cache_disabled(client: Client, pricelists: FakeModel) -> None:
+    assert client.pricelists.price_cache_size == 0
+    client.pricelists.get_prices(1, [(10, 2)])
+    client.pricelists.get_prices(1, [(10, 2)])
+    assert pricelists.price_requests == [(1, 10, 2), (1, 10, 2)]
+    assert not client.pricelists._price_cache
+
+
+def test_price_cache_hit(client: Client, pricelists: FakeModel) -> None:
+    client.pricelists.price_cache_size = 10
+    assert client.pricelists.get_prices(1, [(10, 2), (20, 3)]) == [2.0, 6.0]
+    assert client.pricelists.get_prices(1, [(20, 3), (10, 2)]) == [6.0, 2.0]
+    assert client.pricelists.get_price(1, 10, -2) == 0.0
+    assert pricelists.price_requests == [(1, 10, 2), (1, 20, 3), (1, 10, 0)]
+
+
+def test_price_cache_key(client: Client, pricelists: FakeModel) -> None:
+    client.pricelists.price_cache_size = 10
+    client.pricelists.get_prices(1, [(10, 2)])
+    client.pricelists.get_prices(2, [(10, 2)])
+    client.pricelists.get_prices(1, [(10, 3)])
+    assert pricelists.price_requests == [(1, 10, 2), (2, 10, 2), (1, 10, 3)]
+
+
+def test_price_cache_eviction(client: Client, pricelists: FakeModel) -> None:
+    client.pricelists.price_cache_size = 2
+    client.pricelists.get_prices(1, [(10, 1), (20, 1)])
+    # Using a cached price makes it the most recently used.
+    client.pricelists.get_prices(1, [(10, 1)])
+    client.pricelists.get_prices(1, [(30, 1)])
+    assert list(client.pricelists._price_cache) == [(1, 10, 1), (1, 30, 1)]
+    pricelists.price_requests.clear()
+    client.pricelists.get_prices(1, [(10, 1), (20, 1), (30, 1)])
+    assert pricelists.price_requests == [(1, 20, 1)]
+
+
+def test_clear_price_cache(client: Client, pricelists: FakeModel) -> None:
+    client.pricelists.price_cache_size = 10
+    client.pricelists.get_prices(1, [(10, 2)])
+    client.pricelists.clear_price_cache()
+    client.pricelists.get_prices(1, [(10, 2)])
+    assert pricelists.price_requests == [(1, 10, 2), (1, 10, 2)]
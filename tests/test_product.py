@@ -0,0 +1,196 @@
+# Copyright (C) 2024 Catalyst Cloud Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from openstack_odooclient import Client, Product
+
+    from .conftest import FakeModel, FakeODOO
+
+
+@pytest.fixture
+def products(odoo: FakeODOO) -> FakeModel:
+    model = odoo.env["product.product"]
+    model.records[1] = {
+        "id": 1,
+        "name": "product",
+        "company_id": [5, "company"],
+        "active": True,
+        "sale_ok": True,
+        "standard_price": 1.0,
+    }
+    return model
+
+
+@pytest.fixture
+def product(client: Client, products: FakeModel) -> Product:
+    client.products.record_cache_size = 10
+    client.products.default_fields = ("id", "name")
+    product = client.products.get(1)
+    products.calls.clear()
+    return product
+
+
+def test_list_cached_default_fields(
+    client: Client,
+    products: FakeModel,
+    product: Product,
+) -> None:
+    assert client.products._list_cached([1], fields=["name"]) == [product]
+    assert products.calls == []
+
+
+def test_list_cached_other_fields(
+    client: Client,
+    products: FakeModel,
+    product: Product,
+) -> None:
+    records = client.products._list_cached([1], fields=["standard_price"])
+    assert records[0] is not product
+    assert records[0].standard_price == 1.0
+    assert products.calls == ["read"]
+
+
+@pytest.mark.usefixtures("products")
+def test_get_selects_all_fields(client: Client) -> None:
+    assert client.products.get(1).standard_price == 1.0
+
+
+@pytest.mark.usefixtures("products")
+def test_search_as_dict_selects_all_fields(client: Client) -> None:
+    assert client.products.search(as_dict=True)[0]["standard_price"] == 1.0
+
+
+def test_sellable_products_select_record_fields(
+    client: Client,
+    products: FakeModel,
+) -> None:
+    (product,) = client.products.get_sellable_company_products(5)
+    assert product._fields == client.products.sellable_fields
+    assert product.name == "product"
+    (product_dict,) = client.products.get_sellable_company_products(
+        5,
+        as_dict=True,
+    )
+    assert product_dict["standard_price"] == 1.0
+
+
+@pytest.fixture
+def named_products(products: FakeModel) -> FakeModel:
+    for product_id in (2, 3):
+        products.records[product_id] = {
+            **products.records[1],
+            "id": product_id,
+            "name": f"product-{product_id}",
+        }
+    return products
+
+
+def test_name_cache_disabled(
+    client: Client, named_products: FakeModel
+) -> None:
+    assert client.products.name_cache_size == 0
+    for _ in range(2):
+        client.products.get_sellable_company_product_by_name(5, "product")
+    assert named_products.calls.count("search") == 2  # noqa: PLR2004
+    assert not client.products._name_cache
+
+
+def test_name_cache_hit(client: Client, named_products: FakeModel) -> None:
+    client.products.name_cache_size = 10
+    product = client.products.get_sellable_company_product_by_name(
+        5,
+        "product",
+    )
+    named_products.calls.clear()
+    assert (
+        client.products.get_sellable_company_product_by_name(5, "product")
+        is product
+    )
+    assert named_products.calls == []
+    # Lookups with a different return type are cached separately.
+    assert (
+        client.products.get_sellable_company_product_by_name(
+            5,
+            "product",
+            as_id=True,
+        )
+        == 1
+    )
+    assert named_products.calls != []
+
+
+def test_name_cache_dict_copy(
+    client: Client,
+    named_products: FakeModel,
+) -> None:
+    client.products.name_cache_size = 10
+    product = client.products.get_sellable_company_product_by_name(
+        5,
+        "product",
+        as_dict=True,
+    )
+    product["name"] = "changed"
+    named_products.calls.clear()
+    assert (
+        client.products.get_sellable_company_product_by_name(
+            5,
+            "product",
+            as_dict=True,
+        )["name"]
+        == "product"
+    )
+    assert named_products.calls == []
+
+
+def test_name_cache_not_found(
+    client: Client,
+    named_products: FakeModel,
+) -> None:
+    client.products.name_cache_size = 10
+    for _ in range(2):
+        assert (
+            client.products.get_sellable_company_product_by_name(
+                5,
+                "missing",
+                optional=True,
+            )
+            is None
+        )
+    assert not client.products._name_cache
+
+
+def test_name_cache_eviction(
+    client: Client,
+    named_products: FakeModel,
+) -> None:
+    client.products.name_cache_size = 2
+    by_name = client.products.get_sellable_company_product_by_name
+    by_name(5, "product", as_id=True)
+    by_name(5, "product-2", as_id=True)
+    # Using a cached lookup makes it the most recently used.
+    by_name(5, "product", as_id=True)
+    by_name(5, "product-3", as_id=True)
+    assert [key[1] for key in client.products._name_cache] == [
+        "product",
+        "product-3",
+    ]
+    client.products.clear_name_cache()
+    assert not client.products._name_cache
@@ -0,0 +1,74 @@
+# Copyright (C) 2024 Catalyst Cloud Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from openstack_odooclient import Client
+
+    from .conftest import FakeModel, FakeODOO
+
+
+@pytest.fixture
+def projects(odoo: FakeODOO) -> FakeModel:
+    model = odoo.env["openstack.project"]
+    model.records[1] = {"id": 1, "name": "project", "os_id": "abc"}
+    return model
+
+
+def test_get_by_os_id_cached(client: Client, projects: FakeModel) -> None:
+    client.projects.os_id_cache_size = 10
+    assert client.projects.get_by_os_id("abc", as_id=True) == 1
+    projects.calls.clear()
+    assert client.projects.get_by_os_id("abc", as_id=True) == 1
+    assert projects.calls == []
+    assert client.projects.get_by_os_id("abc").id == 1
+    assert projects.calls == ["read"]
+
+
+def test_get_by_os_id_cached_deleted(
+    client: Client,
+    projects: FakeModel,
+) -> None:
+    client.projects.os_id_cache_size = 10
+    assert client.projects.get_by_os_id("abc").id == 1
+    del projects.records[1]
+    assert client.projects.get_by_os_id("abc", optional=True) is None
+    assert "abc" not in client.projects._os_id_cache
+
+
+def test_get_by_os_id_cached_recreated(
+    client: Client,
+    projects: FakeModel,
+) -> None:
+    client.projects.os_id_cache_size = 10
+    assert client.projects.get_by_os_id("abc").id == 1
+    projects.records[2] = dict(projects.records.pop(1), id=2)
+    assert client.projects.get_by_os_id("abc").id == 2  # noqa: PLR2004
+    assert client.projects._os_id_cache["abc"] == 2  # noqa: PLR2004
+
+
+def test_unlink_clears_os_id_cache(
+    client: Client,
+    projects: FakeModel,
+) -> None:
+    client.projects.os_id_cache_size = 10
+    client.projects.get_by_os_id("abc")
+    client.projects.unlink(1)
+    assert not client.projects._os_id_cache
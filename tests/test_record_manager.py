@@ -0,0 +1,152 @@
+# Copyright (C) 2024 Catalyst Cloud Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import gc
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from openstack_odooclient import RecordNotFoundError
+
+if TYPE_CHECKING:
+    from openstack_odooclient import Client
+
+    from .conftest import FakeODOO
+
+
+@pytest.fixture
+def partners(odoo: FakeODOO) -> None:
+    model = odoo.env["res.partner"]
+    for record_id in (1, 2):
+        model.records[record_id] = {"id": record_id, "name": f"p{record_id}"}
+
+
+@pytest.mark.usefixtures("partners")
+def test_get_optional_not_found(client: Client) -> None:
+    assert client.partners.get(99, optional=True) is None
+
+
+@pytest.mark.usefixtures("partners")
+def test_get_not_found(client: Client) -> None:
+    with pytest.raises(RecordNotFoundError):
+        client.partners.get(99)
+
+
+@pytest.mark.usefixtures("partners")
+def test_list_optional_none_found(client: Client) -> None:
+    assert client.partners.list([98, 99], optional=True) == []
+
+
+@pytest.mark.usefixtures("partners")
+def test_list_not_found(client: Client) -> None:
+    with pytest.raises(RecordNotFoundError):
+        client.partners.list([1, 99])
+
+
+@pytest.mark.usefixtures("partners")
+def test_list_optional_some_found(client: Client) -> None:
+    records = client.partners.list([1, 99], optional=True)
+    assert [record.id for record in records] == [1]
+
+
+@pytest.mark.usefixtures("partners")
+def test_record_cache_not_kept_by_default(client: Client) -> None:
+    client.partners._cache_record(client.partners.get(1))
+    gc.collect()
+    assert 1 not in client.partners._record_cache
+
+
+@pytest.mark.usefixtures("partners")
+def test_record_cache_size(client: Client) -> None:
+    client.partners.record_cache_size = 1
+    client.partners._cache_record(client.partners.get(1))
+    client.partners._cache_record(client.partners.get(2))
+    gc.collect()
+    assert 1 not in client.partners._record_cache
+    assert 2 in client.partners._record_cache  # noqa: PLR2004
+
+
+def test_prefetch_scope_batches(client: Client, odoo: FakeODOO) -> None:
+    model = odoo.env["res.partner"]
+    for record_id in range(1, 26):
+        model.records[record_id] = {
+            "id": record_id,
+            "name": f"p{record_id}",
+            "parent_id": [record_id + 100, f"p{record_id + 100}"],
+        }
+        model.records[record_id + 100] = {
+            "id": record_id + 100,
+            "name": f"p{record_id + 100}",
+            "parent_id": False,
+        }
+    client.partners.prefetch_batch_size = 10
+    with client.prefetch_scope():
+        records = [
+            record
+            for i in range(1, 26, 5)
+            for record in client.partners.list(range(i, i + 5))
+        ]
+        model.calls.clear()
+        for record in records:
+            parent = record.parent
+            assert parent is not None
+            assert parent.id == record.id + 100
+    assert model.calls == ["read", "read", "read"]
+
+
+@pytest.mark.usefixtures("partners")
+def test_search_as_dict_nested_fields(client: Client) -> None:
+    with pytest.raises(ValueError, match=r"parent\.name"):
+        client.partners.search(fields=["name", "parent.name"], as_dict=True)
+
+
+@pytest.mark.usefixtures("partners")
+def test_list_as_dict_nested_fields(client: Client) -> None:
+    with pytest.raises(ValueError, match=r"parent\.name"):
+        client.partners.list([1], fields=["parent.name"], as_dict=True)
+
+
+@pytest.mark.usefixtures("partners")
+def test_search_as_dict_fields(client: Client) -> None:
+    assert client.partners.search(fields=["name"], as_dict=True) == [
+        {"id": 1, "name": "p1"},
+        {"id": 2, "name": "p2"},
+    ]
+
+
+def test_refresh_updates_record_cache(
+    client: Client,
+    odoo: FakeODOO,
+) -> None:
+    model = odoo.env["res.partner"]
+    model.records[1] = {"id": 1, "name": "old", "parent_id": False}
+    model.records[2] = {"id": 2, "name": "child", "parent_id": [1, "old"]}
+    parent = client.partners.get(1)
+    model.records[1]["name"] = "new"
+    refreshed = parent.refresh()
+    assert refreshed.name == "new"
+    child_parent = client.partners.get(2).parent
+    assert child_parent is refreshed
+
+
+@pytest.mark.usefixtures("partners")
+def test_refresh_not_found(client: Client, odoo: FakeODOO) -> None:
+    partner = client.partners.get(1)
+    del odoo.env["res.partner"].records[1]
+    with pytest.raises(RecordNotFoundError):
+        partner.refresh()